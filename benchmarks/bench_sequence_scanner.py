@@ -0,0 +1,65 @@
+"""
+sequence_scanner.walk 와 pyseq.walk 비교 벤치마크
+
+    python benchmarks/bench_sequence_scanner.py                    # 임시 폴더에 100k 프레임 생성 후 측정
+    python benchmarks/bench_sequence_scanner.py --root /show/.../scan/20241226
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python", "app", "tools"))
+import sequence_scanner
+
+
+def make_tree(root, plates, frames):
+    for plate_idx in range(plates):
+        plate_dir = os.path.join(root, f"A{plate_idx:03d}C001")
+        os.makedirs(plate_dir)
+        for frame in range(1001, 1001 + frames):
+            open(os.path.join(plate_dir, f"A{plate_idx:03d}C001_240101.{frame:07d}.exr"), "wb").close()
+
+
+def run(label, walk, root, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        seq_count = 0
+        frame_count = 0
+        for _, _, seqs in walk(root):
+            for seq in seqs:
+                seq_count += 1
+                frame_count += len(seq)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"{label:<18} {best:8.3f}s  ({seq_count} sequences, {frame_count} frames)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--root", help="기존 스캔 폴더 (없으면 임시 폴더 생성)")
+    parser.add_argument("--plates", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="seqbench_") as tmp_dir:
+        root = args.root
+        if not root:
+            root = tmp_dir
+            print(f"[INFO] Creating {args.plates} x {args.frames} frames in {root}")
+            make_tree(root, args.plates, args.frames)
+
+        run("sequence_scanner", sequence_scanner.walk, root, args.repeat)
+        try:
+            import pyseq
+        except ImportError:
+            print("[SKIP] pyseq is not installed")
+        else:
+            run("pyseq", pyseq.walk, root, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
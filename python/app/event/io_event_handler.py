@@ -1,6 +1,6 @@
-from PySide6.QtWidgets import QFileDialog, QTableWidget, QMessageBox
+from PySide6.QtWidgets import QFileDialog, QAbstractItemView, QMessageBox
 import os
-import pandas as pd
+from ..tools.table_export import export_table
 
 def select_directory(line_edit_widget):
     # default_dir = os.path.join(os.path.expanduser("~"), "show")
@@ -43,34 +43,28 @@ def select_xlsx_file(line_edit_widget):
 
 def toggle_edit_mode(table, edit_mode):
     if edit_mode:
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
     else:
-        table.setEditTriggers(QTableWidget.AllEditTriggers)
+        table.setEditTriggers(QAbstractItemView.AllEditTriggers)
     return not edit_mode
 
-def save_table_to_csv(table, csv_path, parent=None):
+def save_table_to_csv(sheet, csv_path, parent=None):
     if not os.path.exists(csv_path):
         QMessageBox.warning(parent, "Save Failed", f"CSV path is not valid\nPlease check csv path on left")
         return False
 
-    row_count = table.rowCount()
-    col_count = table.columnCount()
-
-    headers = []
-    data = []
-    for i in range(1, col_count):
-        headers.append(table.horizontalHeaderItem(i).text())
-
-    for row in range(row_count):
-        row_data = {}
-        for col in range(1, col_count):
-            item = table.item(row, col)
-            row_data[headers[col - 1]] = item.text() if item else ""
-        data.append(row_data)
-
-    df = pd.DataFrame(data)
-    df.to_csv(csv_path, index=False)
+    # DataFrame으로 복사하지 않고 Sheet에서 한 행씩 기록
+    export_table(sheet, csv_path, fmt="csv")
 
     QMessageBox.information(parent, "Save Complete", f"Saved to:\n{csv_path}")
     print(f"[SAVE] Table saved to {csv_path}")
-    return True
\ No newline at end of file
+    return True
+
+def select_export_file(parent, default_path):
+    file_path, _ = QFileDialog.getSaveFileName(
+        parent,
+        "Export table",
+        default_path,
+        "XLSX files (*.xlsx);;CSV files (*.csv);;SQLite files (*.db)"
+    )
+    return file_path or None
@@ -0,0 +1,9 @@
+import os
+
+# date 폴더 안에 툴이 관리하는 파일들(캐시, 인덱스 등)을 모아두는 숨김 폴더
+CACHE_DIR_NAME = ".iomanager"
+
+def get_cache_dir(date_path):
+    cache_dir = os.path.join(date_path, CACHE_DIR_NAME)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
@@ -1,7 +1,10 @@
 import subprocess
 import os
-import pyseq
+from .sequence_scanner import walk
+from .exr_header import read_exr_header, ExrHeaderError
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from PySide6.QtGui import QImage
 
 def exr_to_jpg(input_exr_path, output_jpg_path):
     """
@@ -30,6 +33,58 @@ def exr_to_jpg(input_exr_path, output_jpg_path):
         return False
 
 
+def exr_preview_to_jpg(input_exr_path, output_jpg_path):
+    """
+    EXR header의 preview attribute(RGBA8 이미지)를 그대로 JPG로 저장 (EXR 픽셀 decode 없음)
+    Args:
+        input_exr_path: 원본 EXR 파일 경로
+        output_jpg_path: 출력 JPG 파일 경로
+    Returns:
+        bool: preview가 있고 저장에 성공했는지 여부
+    """
+    try:
+        header = read_exr_header(input_exr_path)
+    except (OSError, ExrHeaderError):
+        return False
+
+    if header["types"].get("preview") != "preview":
+        return False
+    preview = header["attributes"]["preview"]
+    width = preview["width"]
+    height = preview["height"]
+    if not width or not height:
+        return False
+
+    try:
+        with open(input_exr_path, "rb") as f:
+            f.seek(preview["offset"])
+            pixels = f.read(preview["size"])
+    except OSError:
+        return False
+    if len(pixels) != preview["size"]:
+        return False
+
+    # JPG는 alpha가 없으므로 RGB로 변환 후 저장
+    image = QImage(pixels, width, height, width * 4, QImage.Format_RGBA8888)
+    image = image.convertToFormat(QImage.Format_RGB888)
+    if not image.save(output_jpg_path, "JPG", 95):
+        return False
+    print(f"[COMPLETE] Preview Input : {input_exr_path}")
+    print(f"[COMPLETE] Output : {output_jpg_path}")
+    return True
+
+
+def exr_thumbnail_to_jpg(input_exr_path, output_jpg_path):
+    """
+    EXR 썸네일 생성, embedded preview가 있으면 그대로 쓰고 없을 때만 ffmpeg로 전체 decode
+    Returns:
+        bool: 변환 성공 여부
+    """
+    if exr_preview_to_jpg(input_exr_path, output_jpg_path):
+        return True
+    return exr_to_jpg(input_exr_path, output_jpg_path)
+
+
 def mov_to_jpg(input_mov_path, output_jpg_path, all_frames=False):
     """
     ffmpeg을 사용해 MOV 파일에서 JPG 이미지 추출
@@ -65,6 +120,47 @@ def mov_to_jpg(input_mov_path, output_jpg_path, all_frames=False):
         print(f"[EXCEPTION] Error occurred while extracting JPG from MOV: {e}")
         return False
 
+def first_frames_to_jpgs(pairs, chunk_size=16):
+    """
+    여러 EXR/MOV의 첫 프레임을 ffmpeg 한 번에 여러 장씩 JPG로 변환 (입력 여러 개 -> 출력 여러 개)
+    chunk가 통째로 실패하면 해당 chunk만 한 장씩 다시 변환
+    Args:
+        pairs: (원본 경로, 출력 JPG 경로) 리스트
+        chunk_size: ffmpeg 프로세스 하나가 처리할 최대 장 수
+    Returns:
+        list: pairs와 같은 순서의 성공 여부(bool) 리스트
+    """
+    results = []
+    for start in range(0, len(pairs), chunk_size):
+        chunk = [(src, dest) for src, dest in pairs[start:start + chunk_size] if os.path.isfile(src)]
+        # 다시 스캔할 때 이전 썸네일이 남아 있으면 변환에 실패해도 성공으로 판단하므로 먼저 삭제
+        for _, dest in chunk:
+            if os.path.isfile(dest):
+                os.remove(dest)
+        if chunk:
+            cmd = ["ffmpeg", "-loglevel", "error", "-y"]
+            for src, _ in chunk:
+                cmd += ["-i", src]
+            for idx, (_, dest) in enumerate(chunk):
+                cmd += ["-map", f"{idx}:v:0", "-frames:v", "1", "-q:v", "2", dest]
+            try:
+                subprocess.run(cmd, check=True)
+                print(f"[COMPLETE] {len(chunk)} thumbnails converted in one ffmpeg run")
+            except Exception as e:
+                print(f"[EXCEPTION] Batch thumbnail conversion failed, retrying one by one: {e}")
+                for src, dest in chunk:
+                    if src.lower().endswith(".mov"):
+                        mov_to_jpg(src, dest)
+                    else:
+                        exr_to_jpg(src, dest)
+
+        for src, dest in pairs[start:start + chunk_size]:
+            success = os.path.isfile(src) and os.path.isfile(dest)
+            if not os.path.isfile(src):
+                print(f"[ERROR] Source does not exist: {src}")
+            results.append(success)
+    return results
+
 def mov_to_exrs(mov_path, output_dir):
     parts = output_dir.strip("/").split("/")
     seq_shot = parts[-4]  # "S038_0020"
@@ -87,30 +183,77 @@ def mov_to_exrs(mov_path, output_dir):
         return False
 
 
+def _image2_pattern(directory, seq, ext=None):
+    """ffmpeg image2 패턴 경로 (head/tail의 %는 %%로 escape)"""
+    head = seq.head().replace("%", "%%")
+    tail = (seq.tail() if ext is None else ext).replace("%", "%%")
+    return os.path.join(directory, f"{head}{seq.pad_format()}{tail}")
+
+
+def exr_sequence_to_jpgs(seq, dest_dir):
+    """
+    EXR 시퀀스를 연속 구간마다 ffmpeg 한 번으로 JPG 변환 (프레임마다 프로세스를 띄우지 않음)
+    출력 이름과 프레임 번호는 exr_to_jpg와 같음 ex) A001.1001.exr -> dest_dir/A001.1001.jpg
+    구간 변환이 실패하면 그 구간에서 만들어지지 않은 프레임만 한 장씩 다시 변환
+    Args:
+        seq: sequence_scanner.Sequence
+        dest_dir: 출력 폴더
+    Returns:
+        list: seq 프레임 순서의 성공 여부(bool) 리스트 (변환 후 출력 파일이 있는지로 판단)
+    """
+    jpg_paths = [os.path.join(dest_dir, os.path.splitext(frame.name)[0] + ".jpg") for frame in seq]
+    if len(seq) == 1:
+        return [exr_to_jpg(seq[0].path, jpg_paths[0])]
+
+    # 이전 변환 결과가 남아 있으면 성공 여부를 잘못 판단하므로 먼저 삭제
+    for jpg_path in jpg_paths:
+        if os.path.isfile(jpg_path):
+            os.remove(jpg_path)
+
+    paths_by_frame = dict(zip(seq.frames, jpg_paths))
+    input_pattern = _image2_pattern(seq.directory, seq)
+    output_pattern = _image2_pattern(dest_dir, seq, ".jpg")
+    for first, last in seq.contiguous_ranges():
+        cmd = [
+            "ffmpeg", "-loglevel", "error", "-y",
+            "-start_number", str(first),
+            "-i", input_pattern,
+            "-frames:v", str(last - first + 1),
+            "-start_number", str(first),
+            "-q:v", "2",
+            output_pattern,
+        ]
+        try:
+            subprocess.run(cmd, check=True)
+            print(f"[COMPLETE] Frames {first}-{last} : {output_pattern}")
+        except Exception as e:
+            print(f"[EXCEPTION] Range conversion failed ({first}-{last}), retrying missing frames one by one: {e}")
+            for frame in range(first, last + 1):
+                jpg_path = paths_by_frame[frame]
+                if not os.path.isfile(jpg_path):
+                    exr_to_jpg(seq.frame_path(frame), jpg_path)
+
+    results = [os.path.isfile(jpg_path) for jpg_path in jpg_paths]
+    failed = [frame for frame, success in zip(seq.frames, results) if not success]
+    if failed:
+        print(f"[ERROR] {len(failed)} frames not converted: {failed}")
+    return results
+
+
 def exrs_to_jpgs(src_dir, dest_dir):
     if not os.path.isdir(src_dir):
         print(f"[ERROR] Source directory does not exist: {src_dir}")
         return False
     
 
-    for root, dirs, seqs in pyseq.walk(src_dir):
+    for root, dirs, seqs in walk(src_dir):
         for seq in seqs:
             _, ext = os.path.splitext(seq.name)
-            converted_count = 0
             if  ext != ".exr":
                 continue
 
             print(f"\n[INFO] Processing sequence: {seq.head()}{seq.tail()} ({len(seq)} frames)")
-
-            for frame in seq:
-                src_path = frame.path
-                base_name = os.path.splitext(os.path.basename(src_path))[0]
-                jpg_name = base_name + ".jpg"
-                jpg_path = os.path.join(dest_dir, jpg_name)
-
-                success = exr_to_jpg(src_path, jpg_path)
-                if success:
-                    converted_count += 1
+            converted_count = sum(exr_sequence_to_jpgs(seq, dest_dir))
             print(f"\n[COMPLETE] {converted_count} EXR frames successfully converted to JPG.")
     return True
 
@@ -123,7 +266,7 @@ def exrs_to_video(src_dir, dest_dir, vformat='mp4'):
         print(f"[ERROR] Source directory does not exist: {src_dir}")
         return None
 
-    for root, dirs, seqs in pyseq.walk(src_dir):
+    for root, dirs, seqs in walk(src_dir):
         for seq in seqs:
             _, ext = os.path.splitext(seq.name)
             if ext != ".exr":
@@ -178,7 +321,7 @@ def exrs_to_montage(src_path, dest_dir):
     frame_width = 240
     fps = 23.976
 
-    for _, _, seqs in pyseq.walk(src_path):
+    for _, _, seqs in walk(src_path):
         for seq in seqs:
             _, ext = os.path.splitext(seq.name)
             if ext != ".exr":
@@ -236,7 +379,7 @@ def exrs_to_thumbnail(src_path, dest_dir):
     thumbnail_name = f"{seq_shot}_thumbnail_{ver}.jpg"
     output_path = os.path.join(dest_dir, thumbnail_name)
 
-    for _, _, seqs in pyseq.walk(src_path):
+    for _, _, seqs in walk(src_path):
         for seq in seqs:
             _, ext = os.path.splitext(seq.name)
             if ext != ".exr":
@@ -249,7 +392,7 @@ def exrs_to_thumbnail(src_path, dest_dir):
             # ex : "%07d" % 1 >>> "0000001"
             first_frame = padding_str % start
             input_path = os.path.join(src_path, f"{head}{first_frame}{tail}")
-            if exr_to_jpg(input_path, output_path):
+            if exr_thumbnail_to_jpg(input_path, output_path):
                 print(f"[COMPLETE] Thumbnail created at {output_path}")
                 return output_path
             else:
@@ -259,3 +402,135 @@ def exrs_to_thumbnail(src_path, dest_dir):
     print("[ERROR] No EXR sequences found.")
     return None
 
+
+def _derivative_paths(sg_dir):
+    """shotgrid 업로드용 파일 경로 (exrs_to_video / exrs_to_montage / exrs_to_thumbnail과 같은 이름)"""
+    parts = sg_dir.strip("/").split("/")
+    seq_shot = parts[-4]  # "S038_0020"
+    ver = parts[-1]       # "v001"
+    return {
+        "mp4": os.path.join(sg_dir, f"{seq_shot}_plate_{ver}.mp4"),
+        "webm": os.path.join(sg_dir, f"{seq_shot}_plate_{ver}.webm"),
+        "filmstrip": os.path.join(sg_dir, f"{seq_shot}_montage_{ver}.jpg"),
+        "thumbnail": os.path.join(sg_dir, f"{seq_shot}_thumbnail_{ver}.jpg"),
+    }
+
+
+def build_derivatives(input_args, start, jpg_pattern, sg_dir, ffmpeg_path="ffmpeg"):
+    """
+    입력을 한 번만 decode해서 split filter로 JPG 시퀀스 / mp4 / webm / filmstrip / 썸네일을 한 번에 생성
+    Args:
+        input_args: ffmpeg 입력 옵션 ex) ["-start_number", "1001", "-framerate", "23.976", "-i", pattern]
+        start: 첫 프레임 번호 (JPG 출력 번호, filmstrip 프레임 선택 기준)
+        jpg_pattern: JPG 시퀀스 image2 출력 패턴
+        sg_dir: shotgrid 업로드 파일 폴더
+    Returns:
+        dict: {"mp4", "webm", "filmstrip", "thumbnail"} 경로, 실패하면 None
+    """
+    paths = _derivative_paths(sg_dir)
+    frame_increment = 5
+    frame_width = 240
+    fps = 23.976
+
+    filter_graph = (
+        "[0:v]split=5[jpg][mp4][webm][strip][thumb];"
+        f"[strip]select='not(mod((n-{start})\\,{frame_increment}))',setpts='N/({fps}*TB)',"
+        f"scale={frame_width}:-1:flags=lanczos[strip_out]"
+    )
+    with tempfile.TemporaryDirectory(prefix="filmstrip_") as tmp_dir:
+        cmd = [ffmpeg_path, "-loglevel", "error", "-y"] + list(input_args) + [
+            "-filter_complex", filter_graph,
+            "-map", "[jpg]", "-start_number", str(start), "-q:v", "2", jpg_pattern,
+            "-map", "[mp4]", "-c:v", "libx264", "-crf", "25", "-pix_fmt", "yuv420p", paths["mp4"],
+            "-map", "[webm]", "-c:v", "libvpx", "-crf", "25", "-pix_fmt", "yuv420p", paths["webm"],
+            "-map", "[strip_out]", "-qscale:v", "2", "-pix_fmt", "yuvj420p", "-f", "image2",
+            os.path.join(tmp_dir, "thumb_%02d.jpeg"),
+            "-map", "[thumb]", "-frames:v", "1", "-q:v", "2", paths["thumbnail"],
+        ]
+        try:
+            subprocess.run(cmd, check=True)
+            concat_cmd = ["convert", "+append", os.path.join(tmp_dir, "thumb_*.jpeg"), paths["filmstrip"]]
+            subprocess.run(" ".join(concat_cmd), check=True, shell=True)
+        except subprocess.CalledProcessError as e:
+            print(f"[ERROR] Failed to build derivatives: {e}")
+            return None
+
+    print(f"[COMPLETE] Derivatives created in one decode at {sg_dir}")
+    return paths
+
+
+def exrs_to_derivatives(src_dir, jpg_dir, sg_dir):
+    """
+    EXR 시퀀스를 한 번만 decode해서 exrs_to_jpgs / exrs_to_video(mp4, webm) / exrs_to_montage /
+    exrs_to_thumbnail과 같은 결과를 생성 (EXR decode가 publish 시간의 대부분)
+    중간에 빠진 프레임이 있거나 한 번에 만들기에 실패하면 기존 함수로 하나씩 생성
+    Returns:
+        dict: {"mp4", "webm", "filmstrip", "thumbnail"} 경로 (실패한 항목은 None)
+    """
+    for _, _, seqs in walk(src_dir):
+        for seq in seqs:
+            _, ext = os.path.splitext(seq.name)
+            if ext != ".exr" or len(seq) == 1 or len(seq.contiguous_ranges()) > 1:
+                continue
+
+            print(f"\n[INFO] Building derivatives: {seq.head()}{seq.tail()} ({len(seq)} frames)")
+            jpg_paths = [os.path.join(jpg_dir, os.path.splitext(frame.name)[0] + ".jpg") for frame in seq]
+            # 이전 변환 결과가 남아 있으면 성공 여부를 잘못 판단하므로 먼저 삭제
+            for jpg_path in jpg_paths:
+                if os.path.isfile(jpg_path):
+                    os.remove(jpg_path)
+
+            start = seq.start()
+            input_args = ["-start_number", str(start), "-framerate", "23.976", "-i", _image2_pattern(src_dir, seq)]
+            paths = build_derivatives(input_args, start, _image2_pattern(jpg_dir, seq, ".jpg"), sg_dir)
+            converted_count = sum(os.path.isfile(jpg_path) for jpg_path in jpg_paths)
+            if paths is not None and converted_count == len(seq):
+                print(f"[COMPLETE] {converted_count} EXR frames successfully converted to JPG.")
+                return paths
+            break
+
+    print("[INFO] Building derivatives one by one")
+    exrs_to_jpgs(src_dir, jpg_dir)
+    return {
+        "mp4": exrs_to_video(src_dir, sg_dir, vformat="mp4"),
+        "webm": exrs_to_video(src_dir, sg_dir, vformat="webm"),
+        "filmstrip": exrs_to_montage(src_dir, sg_dir),
+        "thumbnail": exrs_to_thumbnail(src_dir, sg_dir),
+    }
+
+
+def mov_to_derivatives(mov_path, org_dir, jpg_dir, sg_dir):
+    """
+    MOV를 바로 decode해서 derivative 생성 (EXR로 변환한 뒤 다시 읽지 않음)
+    JPG 이름과 번호는 mov_to_exrs -> exrs_to_jpgs 결과와 같음 ex) S038_0020_org_v001.0000001.jpg
+    Returns:
+        dict: {"mp4", "webm", "filmstrip", "thumbnail"} 경로, 실패하면 None
+    """
+    parts = org_dir.strip("/").split("/")
+    seq_shot = parts[-4]  # "S038_0020"
+    typ = parts[-2]       # "org"
+    ver = parts[-1]       # "v001"
+    # mov_to_exrs 출력처럼 1번 프레임부터
+    jpg_pattern = os.path.join(jpg_dir, f"{seq_shot}_{typ}_{ver}.%07d.jpg")
+    return build_derivatives(["-i", mov_path], 1, jpg_pattern, sg_dir)
+
+
+def mov_to_publish(mov_path, org_dir, jpg_dir, sg_dir):
+    """
+    mov_to_exrs(org EXR 변환)와 mov_to_derivatives를 동시에 실행
+    MOV에서 바로 만들지 못하면 변환된 EXR로 exrs_to_derivatives 실행
+    Returns:
+        (bool, dict): EXR 변환 성공 여부, derivative 경로 dict (EXR 변환 실패 시 None)
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        exr_future = executor.submit(mov_to_exrs, mov_path, org_dir)
+        derivative_future = executor.submit(mov_to_derivatives, mov_path, org_dir, jpg_dir, sg_dir)
+        success = exr_future.result()
+        derivatives = derivative_future.result()
+
+    if not success:
+        return False, None
+    if derivatives is None:
+        print("[INFO] Building derivatives from converted EXRs")
+        derivatives = exrs_to_derivatives(org_dir, jpg_dir, sg_dir)
+    return True, derivatives
@@ -0,0 +1,236 @@
+import atexit
+import datetime
+import json
+import os
+import queue
+import stat
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+EXIFTOOL_EXECUTABLE = "exiftool"
+DEFAULT_POOL_SIZE = 2
+DEFAULT_BATCH_SIZE = 32
+
+# 확장자별 FileType / MIMEType (exiftool 출력과 동일한 값)
+FILE_TYPES = {
+    ".exr": ("EXR", "image/x-exr"),
+    ".mov": ("MOV", "video/quicktime"),
+}
+
+
+class ExifToolError(Exception):
+    pass
+
+
+class FallbackMetadata(dict):
+    """read_file_tags 결과 표시용 (exiftool 결과가 아니므로 캐시하지 않음)"""
+    pass
+
+
+class ExifToolProcess:
+    """
+    -stay_open 모드로 계속 떠 있는 exiftool 프로세스 하나
+    인자 파일(-@ -)을 stdin으로 보내고 {readyN} 이 나올 때까지 stdout을 읽음
+    """
+
+    def __init__(self, executable=EXIFTOOL_EXECUTABLE):
+        self.executable = executable
+        self._proc = None
+        self._seq = 0
+
+    def start(self):
+        self._proc = subprocess.Popen(
+            [self.executable, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def is_running(self):
+        return self._proc is not None and self._proc.poll() is None
+
+    def execute(self, *args):
+        if not self.is_running():
+            self.start()
+
+        self._seq += 1
+        sentinel = f"{{ready{self._seq}}}".encode()
+        lines = [str(arg) for arg in args] + [f"-execute{self._seq}"]
+
+        try:
+            self._proc.stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
+            self._proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise ExifToolError(f"exiftool stdin closed: {e}")
+
+        fd = self._proc.stdout.fileno()
+        output = bytearray()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise ExifToolError("exiftool process terminated")
+            output += chunk
+            stripped = output.rstrip()
+            if stripped.endswith(sentinel):
+                return bytes(stripped[: -len(sentinel)]).decode("utf-8", "replace")
+
+    def get_metadata(self, paths):
+        """
+        paths를 한 번의 -execute로 처리
+        Returns:
+            dict: SourceFile -> meta dict
+        """
+        if not paths:
+            return {}
+        output = self.execute("-json", "-charset", "filename=utf8", *paths)
+        if not output.strip():
+            return {}
+        return {meta.get("SourceFile"): meta for meta in json.loads(output)}
+
+    def close(self):
+        if self._proc is None:
+            return
+        try:
+            if self._proc.poll() is None:
+                self._proc.stdin.write(b"-stay_open\nFalse\n")
+                self._proc.stdin.flush()
+                self._proc.wait(timeout=5)
+        except Exception:
+            self._proc.kill()
+        self._proc = None
+
+
+class ExifToolPool:
+    """
+    여러 개의 ExifToolProcess를 돌려 쓰는 pool
+    파일 목록을 batch 단위로 나눠 worker에게 분배하고,
+    exiftool이 죽으면 해당 batch는 read_file_tags로 대체
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, batch_size=DEFAULT_BATCH_SIZE,
+                 executable=EXIFTOOL_EXECUTABLE):
+        self.size = max(1, size)
+        self.batch_size = max(1, batch_size)
+        self.executable = executable
+        self._idle = queue.Queue()
+        for _ in range(self.size):
+            self._idle.put(ExifToolProcess(executable))
+        self._available = True
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=self.size)
+
+    def _run_batch(self, batch):
+        if not self._available:
+            return {path: read_file_tags(path) for path in batch}
+
+        proc = self._idle.get()
+        try:
+            found = proc.get_metadata(batch)
+        except FileNotFoundError:
+            # exiftool 미설치
+            with self._lock:
+                if self._available:
+                    print(f"[WARN] '{self.executable}' not found, using python fallback for metadata")
+                self._available = False
+            found = {}
+        except (ExifToolError, ValueError) as e:
+            print(f"[WARN] exiftool worker failed, restarting: {e}")
+            proc.close()
+            found = {}
+        finally:
+            self._idle.put(proc)
+
+        result = {}
+        for path in batch:
+            meta = found.get(path)
+            if meta is None:
+                meta = read_file_tags(path)
+            result[path] = meta
+        return result
+
+    def get_metadata(self, paths):
+        """
+        Args:
+            paths: 메타데이터를 추출할 파일 경로 리스트
+        Returns:
+            list: paths와 같은 순서의 meta dict 리스트
+        """
+        paths = list(paths)
+        batches = [paths[i:i + self.batch_size] for i in range(0, len(paths), self.batch_size)]
+        merged = {}
+        for result in self._executor.map(self._run_batch, batches):
+            merged.update(result)
+        return [merged[path] for path in paths]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        while not self._idle.empty():
+            self._idle.get().close()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_exiftool_pool():
+    """스캔 전체에서 공유하는 ExifToolPool 반환 (최초 호출 시 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExifToolPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def _format_file_size(size):
+    # exiftool의 FileSize 표기 방식
+    if size < 2048:
+        return f"{size} bytes"
+    if size < 10240:
+        return f"{size / 1024:.1f} kB"
+    if size < 2097152:
+        return f"{size / 1024:.0f} kB"
+    if size < 10485760:
+        return f"{size / 1048576:.1f} MB"
+    if size < 2147483648:
+        return f"{size / 1048576:.0f} MB"
+    if size < 10737418240:
+        return f"{size / 1073741824:.1f} GB"
+    return f"{size / 1073741824:.0f} GB"
+
+
+def _format_date(timestamp):
+    dt = datetime.datetime.fromtimestamp(timestamp).astimezone()
+    offset = dt.strftime("%z")
+    return dt.strftime("%Y:%m:%d %H:%M:%S") + f"{offset[:3]}:{offset[3:]}"
+
+
+def read_file_tags(path):
+    """
+    exiftool 없이 os.stat 만으로 만드는 최소한의 메타데이터 (exiftool File 그룹과 같은 키)
+    """
+    meta = FallbackMetadata({
+        "SourceFile": path,
+        "FileName": os.path.basename(path),
+        "Directory": os.path.dirname(path),
+    })
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        meta["Error"] = str(e)
+        return meta
+
+    ext = os.path.splitext(path)[1].lower()
+    file_type, mime_type = FILE_TYPES.get(ext, (ext.lstrip(".").upper(), ""))
+    meta.update({
+        "FileSize": _format_file_size(st.st_size),
+        "FileModifyDate": _format_date(st.st_mtime),
+        "FileAccessDate": _format_date(st.st_atime),
+        "FileInodeChangeDate": _format_date(st.st_ctime),
+        "FilePermissions": stat.filemode(st.st_mode),
+        "FileType": file_type,
+        "FileTypeExtension": ext.lstrip("."),
+        "MIMEType": mime_type,
+    })
+    return meta
@@ -1,65 +1,218 @@
-import subprocess
-import json
 import os
-from .convert import exr_to_jpg, mov_to_jpg
-import pyseq
+from concurrent.futures import ThreadPoolExecutor
+from .convert import exr_preview_to_jpg, first_frames_to_jpgs
+from .exiftool import get_exiftool_pool, FallbackMetadata
+from .exr_header import read_exr_metadata
+from .mov_atoms import read_mov_metadata
+from .metadata_cache import MetadataCache, get_file_signature
+from .manifest import SKIP_DIRS
+from .sequence_scanner import scan, walk
+from .merge_scan import merge_scan
 
-def export_metadata(date_path):
-    # meta data 리스트, xlsx 파일의 한 행이 됌
-    meta_list = []
+def make_thumbnails(items, overwrite=False):
+    """
+    EXR 첫 프레임(embedded preview 우선) / MOV 첫 프레임으로 thumbnail(JPG) 생성
+    preview가 없는 파일은 ffmpeg 한 번에 모아서 변환
+    Args:
+        items: (scan_data_path, thumb_path) 리스트
+        overwrite: True면 이미 있는 썸네일도 다시 생성 (내용이 바뀐 시퀀스)
+    Returns:
+        list: items와 같은 순서의 썸네일 경로 리스트, 실패한 항목은 ""
+    """
+    thumb_paths = [""] * len(items)
+    to_convert = []
+    for idx, (scan_data_path, thumb_path) in enumerate(items):
+        if not overwrite and os.path.exists(thumb_path):
+            print(f"[SKIP] Thumbnail already exist: {thumb_path}")
+            thumb_paths[idx] = thumb_path
+        elif scan_data_path.lower().endswith(".exr") and exr_preview_to_jpg(scan_data_path, thumb_path):
+            print(f"[OK] Thumbnail created from preview: {thumb_path}")
+            thumb_paths[idx] = thumb_path
+        else:
+            to_convert.append(idx)
 
-    # 썸네일 저장 폴더 생성
-    thumbnails_dir = os.path.join(date_path, "thumbnails")
-    os.makedirs(thumbnails_dir, exist_ok=True)
+    results = first_frames_to_jpgs([items[idx] for idx in to_convert])
+    for idx, success in zip(to_convert, results):
+        scan_data_path, thumb_path = items[idx]
+        if success:
+            print(f"[OK] Thumbnail created: {thumb_path}")
+            thumb_paths[idx] = thumb_path
+        else:
+            print(f"[FAIL] Thumbnail create failed: {scan_data_path}")
+    return thumb_paths
+
+def _walk_scan_dirs(date_path, directories=None):
+    """
+    (root, seqs) 반환, directories가 있으면 그 폴더들만 (하위 폴더 제외) 읽음
+    """
+    if directories is not None:
+        for directory in sorted(directories):
+            if os.path.isdir(directory):
+                yield directory, scan(directory)
+        return
+    # .../scan/{date_path} 순회 하면서 Sequence 객체 get (manifest와 같은 폴더 제외 기준)
+    for root, dirs, seqs in walk(date_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        yield root, seqs
 
-    # .../scan/{date_path} 순회 하면서 Sequence 객체 get
-    for root, dirs, seqs in pyseq.walk(date_path):
-        dirs[:] = [d for d in dirs if d != "thumbnails"]
+def _iter_scan_items(date_path, thumbnails_dir, directories=None):
+    """
+    .../scan/{date_path} 를 순회하며 (scan_data_path, thumb_path, size, mtime_ns) 를 하나씩 반환
+    """
+    for root, seqs in _walk_scan_dirs(date_path, directories):
         scan_data_path = "" #exr의 첫 프레임 path / mov path
         for seq in seqs:
             _, ext = os.path.splitext(seq.name)
             # EXR sequnece 폴더의 첫 프레임으로 thumnail(JPG) 추출
             if ext == ".exr":
                 scan_data_path = seq[0].path
+                frame_paths = [frame.path for frame in seq]
                 thumb_name = seq.head().strip(".") + ".jpg"
-                thumb_path = os.path.join(thumbnails_dir, thumb_name)
-                if not os.path.exists(thumb_path):
-                    if exr_to_jpg(scan_data_path, thumb_path):
-                        print(f"[OK] Thumbnail created: {thumb_path}")
-                    else:
-                        print(f"[FAIL] Thumbnail create failed: {scan_data_path}")
-                        thumb_path = ""
-                else:
-                    print(f"[SKIP] Thumbnail already exist: {thumb_path}")
             # MOV 폴더의 첫 프레임 thumbnial(JPG) 추출
             elif ext == ".mov":
                 mov_path = os.path.join(root, seq.name)
                 scan_data_path = mov_path # for export meta data
+                frame_paths = [mov_path]
                 thumb_name = os.path.splitext(seq.name)[0] + ".jpg"
-                thumb_path = os.path.join(thumbnails_dir, thumb_name)
-                if not os.path.exists(thumb_path):
-                    if mov_to_jpg(scan_data_path, thumb_path):
-                        print(f"[OK] Thumbnail created: {thumb_path}")
-                    else:
-                        print(f"[FAIL] Thumbnail create failed: {scan_data_path}")
-                        thumb_path = ""
-
-                else:
-                    print(f"[SKIP] Thumbnail already exist: {thumb_path}")
-
             else:
                 print(f"[SKIP] {seq} is not EXR OR JPG")
                 continue
 
-            # 메타데이터 추출
-            result = subprocess.run(
-                ["exiftool", "-json", scan_data_path],
-                capture_output=True, 
-                text=True
-            )
-
-            # meta data json 파싱
-            meta = json.loads(result.stdout)[0]
-            meta["thumbnail_path"] = thumb_path
-            meta_list.append(meta)
-    return meta_list
\ No newline at end of file
+            thumb_path = os.path.join(thumbnails_dir, thumb_name)
+            size, mtime_ns = get_file_signature(frame_paths)
+            if not mtime_ns:
+                print(f"[SKIP] {seq} was removed during scan")
+                continue
+            yield scan_data_path, thumb_path, size, mtime_ns
+
+def _extract_batch(cache, batch):
+    """
+    batch: (scan_data_path, thumb_path, size, mtime_ns) 리스트
+    Returns:
+        list: batch와 같은 순서의 meta dict 리스트 (thumbnail_path 제외)
+    """
+    # 캐시 조회: (path, size, mtime_ns)가 같으면 exiftool 생략
+    metas = [cache.get(path, size, mtime_ns) for path, _, size, mtime_ns in batch]
+    misses = [idx for idx, meta in enumerate(metas) if meta is None]
+
+    # EXR은 header, MOV는 moov box를 직접 읽고, 읽지 못한 파일만 exiftool로 추출
+    native = {}
+    for idx in misses:
+        path = batch[idx][0]
+        meta = None
+        if path.lower().endswith(".exr"):
+            meta = read_exr_metadata(path)
+        elif path.lower().endswith(".mov"):
+            meta = read_mov_metadata(path)
+        if meta is not None:
+            native[idx] = meta
+    exiftool_misses = [idx for idx in misses if idx not in native]
+
+    # 메타데이터 추출 (stay_open exiftool pool 에서 batch 단위로 처리)
+    extracted = dict(native)
+    extracted.update(zip(
+        exiftool_misses,
+        get_exiftool_pool().get_metadata(batch[idx][0] for idx in exiftool_misses),
+    ))
+    new_entries = []
+    for idx in misses:
+        meta = extracted[idx]
+        path, _, size, mtime_ns = batch[idx]
+        metas[idx] = meta
+        # exiftool이 실패해 fallback으로 만든 값은 다음 스캔에서 다시 추출
+        if not isinstance(meta, FallbackMetadata):
+            new_entries.append((path, size, mtime_ns, meta))
+    cache.put_many(new_entries)
+    return metas
+
+def iter_metadata(date_path, max_workers=None, batch_size=64, directories=None):
+    """
+    export_metadata의 streaming 버전, 시퀀스(행) 하나가 준비되는 대로 meta dict를 yield
+    Args:
+        date_path: .../scan/{date} 경로
+        max_workers: 동시에 돌릴 썸네일 ffmpeg 프로세스 수 (기본값: CPU 개수)
+        batch_size: 메타데이터를 한 번에 추출할 시퀀스 수
+        directories: 이 폴더들만 다시 추출 (추가/변경된 행), 썸네일도 새로 생성
+    """
+    # 썸네일 저장 폴더 생성
+    thumbnails_dir = os.path.join(date_path, "thumbnails")
+    os.makedirs(thumbnails_dir, exist_ok=True)
+
+    # 썸네일은 thread pool에서 ffmpeg 여러 개를 동시에 돌리고,
+    # 그동안 메타데이터 추출
+    max_workers = max_workers or os.cpu_count() or 1
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    cache = MetadataCache(date_path)
+    scanned_paths = []
+    completed = False
+    # 첫 행이 빨리 보이도록 batch 크기를 1부터 batch_size까지 늘려감
+    current_batch_size = 1
+    try:
+        pending = []
+        items = _iter_scan_items(date_path, thumbnails_dir, directories)
+        while True:
+            item = next(items, None)
+            if item is not None:
+                scanned_paths.append(item[0])
+                pending.append(item)
+                if len(pending) < current_batch_size:
+                    continue
+            if not pending:
+                break
+
+            # batch를 worker 수만큼 나눠서 ffmpeg 프로세스 하나가 여러 장씩 변환
+            chunk_size = -(-len(pending) // max_workers)
+            thumb_jobs = [
+                executor.submit(
+                    make_thumbnails,
+                    [(path, thumb_path) for path, thumb_path, _, _ in pending[i:i + chunk_size]],
+                    directories is not None,
+                )
+                for i in range(0, len(pending), chunk_size)
+            ]
+            metas = _extract_batch(cache, pending)
+
+            # 스캔 순서대로 yield
+            thumb_paths = [thumb_path for job in thumb_jobs for thumb_path in job.result()]
+            for meta, thumb_path in zip(metas, thumb_paths):
+                meta["thumbnail_path"] = thumb_path
+                yield meta
+            pending = []
+            current_batch_size = min(current_batch_size * 2, batch_size)
+
+        # 일부 폴더만 읽은 경우 다른 폴더의 캐시는 그대로 둠
+        if directories is None:
+            cache.prune(scanned_paths)
+        completed = True
+    finally:
+        cache.close()
+        # 중간에 멈춘 경우 아직 시작하지 않은 썸네일 작업은 취소
+        executor.shutdown(wait=True, cancel_futures=not completed)
+
+def export_metadata(date_path, max_workers=None, directories=None):
+    """
+    Args:
+        date_path: .../scan/{date} 경로
+        max_workers: 동시에 돌릴 썸네일 ffmpeg 프로세스 수 (기본값: CPU 개수)
+        directories: 이 폴더들만 추출 (None이면 전체)
+    Returns:
+        list: 시퀀스(행)별 meta dict 리스트
+    """
+    # meta data 리스트, xlsx 파일의 한 행이 됌
+    meta_list = list(iter_metadata(date_path, max_workers=max_workers, directories=directories))
+    print(f"[COMPLETE] Metadata exported: {len(meta_list)} rows")
+    return meta_list
+
+
+def rescan_changes(date_path, old_sheet, diff, max_workers=None):
+    """
+    diff_directories로 고른 폴더만 다시 추출해서 이전 버전과 합침 (비용이 변경 규모에 비례)
+    추출하면서 해당 폴더의 썸네일을 다시 만들므로 사용자가 새 버전 저장을 확인한 뒤에 호출
+    Returns:
+        (Sheet, ScanDiff): 실제로 바뀐 것이 없으면 ScanDiff는 False
+    """
+    targets = diff.added | diff.changed
+    metas = export_metadata(date_path, max_workers=max_workers, directories=targets) if targets else []
+    sheet = merge_scan(old_sheet, metas, diff)
+    print(f"[INFO] Scan folder changes after extraction: {diff}")
+    return sheet, diff
@@ -0,0 +1,353 @@
+import struct
+from .exiftool import read_file_tags
+
+EXR_MAGIC = 20000630
+# header는 이 크기 단위로 필요한 만큼만 읽음 (preview 픽셀은 seek으로 건너뜀)
+READ_CHUNK_SIZE = 4 * 1024
+# preview를 제외한 attribute가 이보다 길면 깨진 파일로 봄
+MAX_HEADER_SIZE = 8 * 1024 * 1024
+
+TILED_FLAG = 0x200
+LONG_NAMES_FLAG = 0x400
+NON_IMAGE_FLAG = 0x800
+MULTIPART_FLAG = 0x1000
+
+COMPRESSION_NAMES = {
+    0: "None", 1: "RLE", 2: "ZIPS", 3: "ZIP", 4: "PIZ",
+    5: "PXR24", 6: "B44", 7: "B44A", 8: "DWAA", 9: "DWAB",
+}
+LINE_ORDER_NAMES = {0: "Increasing Y", 1: "Decreasing Y", 2: "Random Y"}
+PIXEL_TYPE_NAMES = {0: "uint", 1: "half", 2: "float"}
+ENVMAP_NAMES = {0: "Latitude/Longitude", 1: "Cube"}
+
+
+class ExrHeaderError(Exception):
+    pass
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+class _Reader(object):
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def take(self, size):
+        end = self.pos + size
+        if end > len(self.data):
+            raise _NeedMoreData()
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def unpack(self, fmt):
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))
+
+    def cstring(self):
+        end = self.data.find(b"\0", self.pos)
+        if end < 0:
+            raise _NeedMoreData()
+        value = self.data[self.pos:end]
+        self.pos = end + 1
+        return value.decode("utf-8", "replace")
+
+
+class _FileReader(object):
+    """
+    파일을 READ_CHUNK_SIZE씩 필요한 만큼만 읽는 reader (pos는 파일 안의 절대 위치)
+    skip은 버퍼에 담지 않고 seek으로 건너뜀
+    """
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = b""
+        self.buf_start = 0
+        self.pos = 0
+        self.buffered = 0
+
+    def _fill(self, end):
+        while self.buf_start + len(self.buf) < end:
+            if self.buffered >= MAX_HEADER_SIZE:
+                raise ExrHeaderError("EXR header too large")
+            self.f.seek(self.buf_start + len(self.buf))
+            chunk = self.f.read(READ_CHUNK_SIZE)
+            if not chunk:
+                raise ExrHeaderError("Truncated EXR header")
+            self.buf += chunk
+            self.buffered += len(chunk)
+
+    def take(self, size):
+        if size < 0:
+            raise ExrHeaderError("Invalid EXR attribute size")
+        self._fill(self.pos + size)
+        start = self.pos - self.buf_start
+        self.pos += size
+        return self.buf[start:start + size]
+
+    def unpack(self, fmt):
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))
+
+    def cstring(self):
+        while True:
+            end = self.buf.find(b"\0", self.pos - self.buf_start)
+            if end >= 0:
+                value = self.buf[self.pos - self.buf_start:end]
+                self.pos = self.buf_start + end + 1
+                return value.decode("utf-8", "replace")
+            self._fill(self.buf_start + len(self.buf) + 1)
+
+    def skip(self, size):
+        if size < 0:
+            raise ExrHeaderError("Invalid EXR attribute size")
+        self.pos += size
+        if self.pos > self.buf_start + len(self.buf):
+            # 버퍼 밖으로 나가면 버리고 다음 읽기는 새 위치부터
+            self.buf = b""
+            self.buf_start = self.pos
+
+
+def _decode_chlist(value):
+    reader = _Reader(value)
+    channels = []
+    while True:
+        name = reader.cstring()
+        if not name:
+            break
+        pixel_type, _p_linear, x_sampling, y_sampling = reader.unpack("<iB3xii")
+        channels.append({
+            "name": name,
+            "type": PIXEL_TYPE_NAMES.get(pixel_type, str(pixel_type)),
+            "x_sampling": x_sampling,
+            "y_sampling": y_sampling,
+        })
+    return channels
+
+
+def _decode_timecode(value):
+    time_and_flags, user_data = struct.unpack("<II", value)
+
+    def bcd(shift, tens_bits):
+        units = (time_and_flags >> shift) & 0xF
+        tens = (time_and_flags >> (shift + 4)) & ((1 << tens_bits) - 1)
+        return tens * 10 + units
+
+    return {
+        "hours": bcd(24, 2),
+        "minutes": bcd(16, 3),
+        "seconds": bcd(8, 3),
+        "frame": bcd(0, 2),
+        "drop_frame": bool(time_and_flags & (1 << 6)),
+        "user_data": user_data,
+    }
+
+
+def _decode_stringvector(value):
+    reader = _Reader(value)
+    strings = []
+    while reader.pos < len(value):
+        (size,) = reader.unpack("<i")
+        strings.append(reader.take(size).decode("utf-8", "replace"))
+    return strings
+
+
+def _decode_preview(value, value_offset):
+    width, height = struct.unpack("<II", value[:8])
+    return {
+        "width": width,
+        "height": height,
+        # 파일 안에서 RGBA8 픽셀 데이터 시작 위치
+        "offset": value_offset + 8,
+        "size": width * height * 4,
+    }
+
+
+_FIXED_TYPES = {
+    "box2i": "<4i",
+    "box2f": "<4f",
+    "v2i": "<2i",
+    "v2f": "<2f",
+    "v3i": "<3i",
+    "v3f": "<3f",
+    "m33f": "<9f",
+    "m44f": "<16f",
+    "m33d": "<9d",
+    "m44d": "<16d",
+    "chromaticities": "<8f",
+    "keycode": "<7i",
+}
+
+
+def _decode_value(type_name, value, value_offset):
+    """
+    Returns:
+        (decoded, known): known 이 False 면 이 파서가 모르는 attribute type
+    """
+    if type_name in _FIXED_TYPES:
+        return struct.unpack(_FIXED_TYPES[type_name], value), True
+    if type_name == "int":
+        return struct.unpack("<i", value)[0], True
+    if type_name == "float":
+        return struct.unpack("<f", value)[0], True
+    if type_name == "double":
+        return struct.unpack("<d", value)[0], True
+    if type_name == "string":
+        return value.decode("utf-8", "replace"), True
+    if type_name == "compression":
+        return COMPRESSION_NAMES.get(value[0], str(value[0])), True
+    if type_name == "lineOrder":
+        return LINE_ORDER_NAMES.get(value[0], str(value[0])), True
+    if type_name == "envmap":
+        return ENVMAP_NAMES.get(value[0], str(value[0])), True
+    if type_name == "chlist":
+        return _decode_chlist(value), True
+    if type_name == "rational":
+        return struct.unpack("<iI", value), True
+    if type_name == "timecode":
+        return _decode_timecode(value), True
+    if type_name == "stringvector":
+        return _decode_stringvector(value), True
+    if type_name == "floatvector":
+        return struct.unpack(f"<{len(value) // 4}f", value), True
+    if type_name == "tiledesc":
+        x_size, y_size, mode = struct.unpack("<IIB", value)
+        return {"x_size": x_size, "y_size": y_size, "mode": mode}, True
+    if type_name == "preview":
+        return _decode_preview(value, value_offset), True
+    return value, False
+
+
+def _parse_header(f):
+    reader = _FileReader(f)
+    magic, version_field = reader.unpack("<iI")
+    if magic != EXR_MAGIC:
+        raise ExrHeaderError("Not an OpenEXR file")
+
+    header = {
+        "version": version_field & 0xFF,
+        "flags": version_field & ~0xFF,
+        "attributes": {},
+        "types": {},
+        "unknown": [],
+    }
+    # multipart 파일은 첫 번째 part header만 읽음
+    while True:
+        name = reader.cstring()
+        if not name:
+            break
+        type_name = reader.cstring()
+        (size,) = reader.unpack("<i")
+        value_offset = reader.pos
+        if type_name == "preview" and size >= 8:
+            # preview 픽셀은 읽지 않고 위치만 기록
+            value = reader.take(8)
+            reader.skip(size - 8)
+        else:
+            value = reader.take(size)
+        try:
+            decoded, known = _decode_value(type_name, value, value_offset)
+        except (struct.error, IndexError, _NeedMoreData):
+            decoded, known = value, False
+        header["attributes"][name] = decoded
+        header["types"][name] = type_name
+        if not known:
+            header["unknown"].append(name)
+    header["header_size"] = reader.pos
+    return header
+
+
+def read_exr_header(path):
+    """
+    EXR 파일 앞부분만 읽어서 header attribute 파싱 (픽셀 데이터, preview 픽셀은 읽지 않음)
+    Returns:
+        dict: {"version", "flags", "attributes", "types", "unknown", "header_size"}
+    """
+    with open(path, "rb") as f:
+        try:
+            return _parse_header(f)
+        except ExrHeaderError as e:
+            raise ExrHeaderError(f"{e}: {path}")
+        except struct.error as e:
+            raise ExrHeaderError(f"Invalid EXR header: {e}")
+
+
+def _format_number(value):
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
+def _format_attribute(type_name, value):
+    # exiftool OpenEXR 태그와 비슷한 문자열로 변환
+    if type_name == "chlist":
+        return ", ".join(
+            f"{ch['name']} {ch['type']} ({ch['x_sampling']} {ch['y_sampling']})" for ch in value
+        )
+    if type_name == "timecode":
+        sep = ";" if value["drop_frame"] else ":"
+        return f"{value['hours']:02d}:{value['minutes']:02d}:{value['seconds']:02d}{sep}{value['frame']:02d}"
+    if type_name == "rational":
+        numerator, denominator = value
+        return f"{numerator}/{denominator}"
+    if type_name == "stringvector":
+        return ", ".join(value)
+    if type_name == "tiledesc":
+        return f"{value['x_size']} {value['y_size']} {value['mode']}"
+    if isinstance(value, tuple):
+        return " ".join(_format_number(v) for v in value)
+    if isinstance(value, float):
+        # exiftool -json 처럼 숫자 하나는 숫자로 (1.0 -> 1, float32 오차는 %g 로 정리)
+        return int(value) if value.is_integer() else float(_format_number(value))
+    return value
+
+
+def _flag_names(flags):
+    names = []
+    if flags & TILED_FLAG:
+        names.append("Tiled")
+    if flags & LONG_NAMES_FLAG:
+        names.append("Long names")
+    if flags & NON_IMAGE_FLAG:
+        names.append("Deep data")
+    if flags & MULTIPART_FLAG:
+        names.append("Multipart")
+    return ", ".join(names) if names else "(none)"
+
+
+def read_exr_metadata(path):
+    """
+    exiftool -json 결과와 같은 키를 갖는 EXR 메타데이터
+    Returns:
+        dict: meta dict, 파싱 실패 또는 모르는 attribute가 있으면 None (exiftool로 대체)
+    """
+    try:
+        header = read_exr_header(path)
+    except (OSError, ExrHeaderError) as e:
+        print(f"[WARN] EXR header read failed, fallback to exiftool: {e}")
+        return None
+    if header["unknown"]:
+        print(f"[INFO] Unknown EXR attributes {header['unknown']}, fallback to exiftool: {path}")
+        return None
+
+    meta = dict(read_file_tags(path))
+    meta["EXRVersion"] = header["version"]
+    meta["Flags"] = _flag_names(header["flags"])
+
+    for name, value in header["attributes"].items():
+        type_name = header["types"][name]
+        if type_name == "preview":
+            continue
+        tag = name[:1].upper() + name[1:]
+        meta[tag] = _format_attribute(type_name, value)
+
+    data_window = header["attributes"].get("dataWindow")
+    if data_window:
+        x_min, y_min, x_max, y_max = data_window
+        width = x_max - x_min + 1
+        height = y_max - y_min + 1
+        meta["ImageWidth"] = width
+        meta["ImageHeight"] = height
+        meta["ImageSize"] = f"{width}x{height}"
+        meta["Megapixels"] = round(width * height / 1000000, 1)
+    return meta
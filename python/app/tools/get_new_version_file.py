@@ -1,18 +1,8 @@
-import os
-import re
+from .version_index import reserve_version_path
 
 def get_new_version_name(date_path):
-    date_prefix = os.path.basename(os.path.normpath(date_path))
-    
-    pattern = re.compile(rf"{date_prefix}_list_v(\d{{3}})\.xlsx$")
-    versions = []
-
-    for fname in os.listdir(date_path):
-        match = pattern.match(fname)
-        if match:
-            version = int(match.group(1))
-            versions.append(version)
-
-    next_version = max(versions) + 1
-    file_name = f"{date_prefix}_list_v{next_version:03d}.xlsx"
-    return os.path.join(date_path, file_name)
+    """
+    다음 버전 xlsx 경로를 예약해서 반환 (동시에 저장해도 번호가 겹치지 않음)
+    저장하면 mark_version_saved, 취소하면 release_version 호출
+    """
+    return reserve_version_path(date_path)
@@ -1,7 +1,11 @@
-from openpyxl import load_workbook
+from .sheet_reader import read_projection
+from .version_store import is_version_available
 import os
 import re
 
+# publish에 필요한 열
+PUBLISH_HEADERS = ["seq_name", "shot_name", "Directory"]
+
 def get_latest_plate_version(dir_list):
     version_nums = []
     for name in dir_list:
@@ -14,31 +18,39 @@ def get_latest_plate_version(dir_list):
     else:
         return "v001"
 
-def get_publish_info(xlsx_file_path, checked_rows):
-    if os.path.exists(xlsx_file_path):
-        wb = load_workbook(xlsx_file_path)
-        ws = wb.active
+def get_publish_info(xlsx_file_path, checked_rows, sheet=None):
+    """
+    Args:
+        xlsx_file_path: 현재 테이블에 표시 중인 xlsx 경로
+        checked_rows: 체크된 행의 xlsx 행 번호 리스트 (헤더가 1행이므로 2부터 시작)
+        sheet: 이미 읽어둔 Sheet (없으면 체크된 행의 필요한 열만 읽음)
+    """
+    if sheet is not None or is_version_available(xlsx_file_path):
+        rows = [row_idx - 2 for row_idx in checked_rows]
+        if sheet is None:
+            headers, records = read_projection(xlsx_file_path, PUBLISH_HEADERS, rows)
+            records = {row: dict(zip(headers, values)) for row, values in records}
+        else:
+            records = {
+                row: {header: sheet.value(row, header) for header in PUBLISH_HEADERS}
+                for row in rows if 0 <= row < len(sheet)
+            }
 
         parts = os.path.normpath(xlsx_file_path).split(os.sep)
         show_idx = parts.index("show")
         project_name = parts[show_idx + 1]
 
-        # 첫 번째 행에서 헤더 인덱스 찾기
-        # headers ex : {'seq_name': 0, 'shot_name': 1, 'type': 2, 'Directory': 3}
-        headers = {}
-        for col_idx, cell in enumerate(ws[1]):
-            headers[cell.value] = col_idx
-
         # 각 행에서 dict 구성
         data = []
-        for row_idx, row in enumerate(ws.iter_rows(min_row=2, values_only=True), start=2):
-            if row_idx not in checked_rows:
+        for row_idx in sorted(checked_rows):
+            record = records.get(row_idx - 2)
+            if record is None:
                 continue
 
-            seq = row[headers["seq_name"]]
-            shot = row[headers["shot_name"]]
-            #typ = row[headers["type"]]
-            directory = row[headers["Directory"]]
+            seq = record.get("seq_name", "")
+            shot = record.get("shot_name", "")
+            #typ = record.get("type", "")
+            directory = record.get("Directory", "")
 
             if not (seq and shot and directory):
                 print(f"[SKIP] Not enough information in excel file : row num {row_idx}")
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+from .cache_dir import CACHE_DIR_NAME
+from .sequence_scanner import walk
+from .version_store import load_stored_manifest
+
+# 스캔 대상이 아닌 폴더
+SKIP_DIRS = ("thumbnails", CACHE_DIR_NAME)
+# 메타데이터를 추출하는 시퀀스 확장자 (export_metadata와 같음)
+SCAN_EXTS = (".exr", ".mov")
+
+
+def get_manifest_path(xlsx_path):
+    # 20241226_list_v001.xlsx -> 20241226_list_v001.manifest.json
+    return os.path.splitext(xlsx_path)[0] + ".manifest.json"
+
+
+def iter_scan_sequences(date_path):
+    """
+    export_metadata가 행으로 만드는 시퀀스와 같은 단위로 (root, Sequence) 반환
+    (sequence_scanner.walk 그룹핑, thumbnails / .iomanager 폴더 제외)
+    """
+    for root, dirs, seqs in walk(date_path):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for seq in seqs:
+            if os.path.splitext(seq.name)[1] in SCAN_EXTS:
+                yield root, seq
+
+
+def _frame_stats(paths):
+    sizes = []
+    mtimes = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        sizes.append(st.st_size)
+        mtimes.append(st.st_mtime_ns)
+    return sum(sizes), max(mtimes, default=0)
+
+
+def build_manifest(date_path):
+    """
+    date 폴더의 시퀀스별 요약(manifest) 생성, 번호가 없는 단일 EXR / MOV도 시퀀스 하나로 기록
+    Returns:
+        dict: {"digest": str, "sequences": [{path, start, end, frames, bytes, mtime_ns}, ...]}
+    """
+    sequences = []
+    for _, seq in iter_scan_sequences(date_path):
+        size, mtime_ns = _frame_stats(frame.path for frame in seq)
+        sequences.append({
+            "path": seq.path(),
+            "start": seq.start(),
+            "end": seq.end(),
+            "frames": len(seq),
+            "bytes": size,
+            "mtime_ns": mtime_ns,
+        })
+    sequences.sort(key=lambda seq: seq["path"])
+
+    digest = hashlib.sha1(json.dumps(sequences, sort_keys=True).encode("utf-8")).hexdigest()
+    return {"digest": digest, "sequences": sequences}
+
+
+def write_manifest(xlsx_path, manifest):
+    manifest_path = get_manifest_path(xlsx_path)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+    return manifest_path
+
+
+def load_manifest(xlsx_path):
+    manifest_path = get_manifest_path(xlsx_path)
+    if not os.path.exists(manifest_path):
+        # xlsx 없이 히스토리에만 저장된 버전
+        return load_stored_manifest(xlsx_path)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[WARN] Manifest read failed: {e}")
+        return None
+
+
+def is_manifest_current(xlsx_path, manifest):
+    """
+    xlsx에 저장된 manifest와 현재 스캔 폴더의 manifest 비교
+    Returns:
+        bool: digest가 같으면 True, 다르거나 저장된 manifest가 없으면 False
+    """
+    stored = load_manifest(xlsx_path)
+    if stored is None:
+        return False
+    return stored.get("digest") == manifest["digest"]
@@ -0,0 +1,174 @@
+import os
+from .sequence_scanner import FRAME_RE
+from .sheet import Sheet, normalize_value
+
+# 사용자가 테이블에서 직접 입력하는 열 (다시 스캔해도 이전 값 유지)
+USER_FIELDS = ("seq_name", "shot_name")
+# 파일을 읽기만 해도 바뀌는 값은 변경 비교에서 제외
+VOLATILE_FIELDS = ("FileAccessDate", "FileInodeChangeDate", "thumbnail_path")
+
+
+class ScanDiff(object):
+    """
+    Directory 기준 이전 버전과 현재 스캔 폴더의 차이
+    added / removed / changed: Directory(normpath) set
+    """
+
+    def __init__(self, added=(), removed=(), changed=()):
+        self.added = set(added)
+        self.removed = set(removed)
+        self.changed = set(changed)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return f"ScanDiff(added={len(self.added)}, removed={len(self.removed)}, changed={len(self.changed)})"
+
+
+def _directory_key(directory):
+    return os.path.normpath(str(directory)) if directory else ""
+
+
+def _manifest_directories(manifest):
+    """manifest의 시퀀스를 폴더별로 묶어서 {Directory: 시퀀스 요약 tuple}"""
+    directories = {}
+    for seq in manifest.get("sequences", []):
+        key = _directory_key(os.path.dirname(seq["path"]))
+        summary = (seq["path"], seq["start"], seq["end"], seq["frames"], seq["bytes"], seq["mtime_ns"])
+        directories.setdefault(key, []).append(summary)
+    return {key: tuple(sorted(seqs)) for key, seqs in directories.items()}
+
+
+def diff_directories(old_directories, old_manifest, new_manifest):
+    """
+    manifest만 비교해서 다시 추출할 폴더를 고름 (메타데이터 추출 전 단계)
+    Args:
+        old_directories: 이전 버전 xlsx의 Directory 열
+        old_manifest: 이전 버전과 함께 저장된 manifest (없으면 None)
+        new_manifest: 현재 스캔 폴더의 manifest
+    Returns:
+        ScanDiff: changed는 manifest 요약이 달라진 폴더
+            (manifest 없이 저장된 버전은 비교할 요약이 없으므로 Directory 목록만 비교)
+    """
+    old_keys = {_directory_key(directory) for directory in old_directories if directory}
+    new_dirs = _manifest_directories(new_manifest)
+    new_keys = set(new_dirs)
+
+    common = old_keys & new_keys
+    if old_manifest is None:
+        changed = set()
+    else:
+        old_dirs = _manifest_directories(old_manifest)
+        changed = {key for key in common if old_dirs.get(key) != new_dirs[key]}
+    return ScanDiff(added=new_keys - old_keys, removed=old_keys - new_keys, changed=changed)
+
+
+def _sequence_name(file_name):
+    """
+    폴더 안에서 시퀀스를 구분하는 이름 (EXR은 첫 프레임 번호를 뺀 head + tail)
+    ex) A001.1001.exr -> A001..exr, 첫 프레임이 바뀌어도 같은 시퀀스
+    """
+    file_name = str(file_name or "")
+    if file_name.lower().endswith(".exr"):
+        match = FRAME_RE.match(file_name)
+        if match:
+            head, _, tail = match.groups()
+            return f"{head}{tail}"
+    return file_name
+
+
+def _row_key(directory, file_name, source_file=""):
+    if not file_name and source_file:
+        file_name = os.path.basename(str(source_file))
+    return _directory_key(directory), _sequence_name(file_name)
+
+
+def _group_rows(sheet):
+    """{(Directory, 시퀀스 이름): [행 번호, ...]}"""
+    rows = {}
+    for row in range(len(sheet)):
+        key = _row_key(sheet.value(row, "Directory"), sheet.value(row, "FileName"), sheet.value(row, "SourceFile"))
+        rows.setdefault(key, []).append(row)
+    return rows
+
+
+def _group_metas(metas):
+    grouped = {}
+    for meta in metas:
+        key = _row_key(meta.get("Directory"), meta.get("FileName"), meta.get("SourceFile"))
+        grouped.setdefault(key, []).append(meta)
+    return grouped
+
+
+def _meta_differs(sheet, row, meta):
+    for key, value in meta.items():
+        if key in VOLATILE_FIELDS or key in USER_FIELDS:
+            continue
+        if sheet.value(row, key, None) != normalize_value(value):
+            return True
+    return False
+
+
+def merge_scan(old_sheet, metas, diff):
+    """
+    이전 버전 Sheet에 새로 추출한 행만 반영한 새 Sheet
+    - removed 폴더의 행은 삭제
+    - 다시 추출한 폴더의 행은 (Directory, 시퀀스 이름)이 같은 행끼리 짝지어 메타데이터 열만 갱신
+      (USER_FIELDS, 스캔에 없는 열은 유지, 폴더 안의 순서와 상관없음)
+    - 사라진 시퀀스의 행은 삭제, 새 폴더 / 새 시퀀스의 행은 끝에 추가
+    Args:
+        old_sheet: 이전 버전 Sheet
+        metas: diff.added | diff.changed 폴더의 meta dict 리스트 (export_metadata 결과)
+        diff: diff_directories 결과, changed는 실제로 값이 바뀐 폴더만 남도록 갱신됨
+    Returns:
+        Sheet
+    """
+    new_by_key = _group_metas(metas)
+    old_by_key = _group_rows(old_sheet)
+
+    # 다시 추출했지만 값이 같은 폴더는 changed에서 제외
+    for directory in list(diff.changed):
+        old_keys = {key for key in old_by_key if key[0] == directory}
+        new_keys = {key for key in new_by_key if key[0] == directory}
+        if old_keys != new_keys:
+            continue
+        same = all(
+            len(old_by_key[key]) == len(new_by_key[key])
+            and not any(_meta_differs(old_sheet, row, meta) for row, meta in zip(old_by_key[key], new_by_key[key]))
+            for key in old_keys
+        )
+        if same:
+            diff.changed.discard(directory)
+
+    sheet = Sheet(old_sheet.headers, path=old_sheet.path)
+    used = {}
+    for row in range(len(old_sheet)):
+        key = _row_key(old_sheet.value(row, "Directory"), old_sheet.value(row, "FileName"),
+                       old_sheet.value(row, "SourceFile"))
+        if key[0] in diff.removed:
+            continue
+        values = old_sheet.row(row)
+        if key[0] in diff.changed:
+            new = new_by_key.get(key, [])
+            index = used.get(key, 0)
+            used[key] = index + 1
+            if index >= len(new):
+                # 폴더에서 사라진 시퀀스
+                continue
+            for field, value in new[index].items():
+                if field not in USER_FIELDS:
+                    values[field] = value
+        sheet.append_row(values)
+
+    # 새 폴더 + 기존 폴더에 새로 생긴 시퀀스 (스캔 순서대로)
+    targets = diff.added | diff.changed
+    for meta in metas:
+        key = _row_key(meta.get("Directory"), meta.get("FileName"), meta.get("SourceFile"))
+        if key[0] not in targets:
+            continue
+        if used.get(key, 0) > 0:
+            used[key] -= 1
+            continue
+        sheet.append_row(meta)
+    return sheet
@@ -0,0 +1,82 @@
+import json
+import os
+import sqlite3
+import threading
+from .cache_dir import get_cache_dir
+
+CACHE_FILE_NAME = "metadata_cache.db"
+
+
+class MetadataCache:
+    """
+    date 폴더 단위의 메타데이터 캐시 (SQLite)
+    (path, size, mtime_ns) 가 모두 같을 때만 저장된 meta dict를 돌려줌
+    """
+
+    def __init__(self, date_path):
+        self.db_path = os.path.join(get_cache_dir(date_path), CACHE_FILE_NAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, meta TEXT)"
+        )
+        self._conn.commit()
+
+    def get(self, path, size, mtime_ns):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta FROM metadata WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (path, size, mtime_ns),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def put_many(self, entries):
+        """entries: (path, size, mtime_ns, meta) 리스트"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metadata (path, size, mtime_ns, meta) VALUES (?, ?, ?, ?)",
+                [(path, size, mtime_ns, json.dumps(meta, default=str))
+                 for path, size, mtime_ns, meta in entries],
+            )
+            self._conn.commit()
+
+    def prune(self, keep_paths):
+        """스캔에서 사라진 path의 엔트리 삭제"""
+        keep_paths = set(keep_paths)
+        with self._lock:
+            stored = [row[0] for row in self._conn.execute("SELECT path FROM metadata")]
+            removed = [(path,) for path in stored if path not in keep_paths]
+            if removed:
+                self._conn.executemany("DELETE FROM metadata WHERE path = ?", removed)
+                self._conn.commit()
+        return len(removed)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_file_signature(paths):
+    """
+    파일(또는 시퀀스의 모든 프레임)의 (총 byte 크기, 가장 최근 mtime_ns)
+    스캔 중에 지워진 프레임은 건너뜀 (읽을 수 있는 파일이 없으면 (0, 0))
+    """
+    total_size = 0
+    latest_mtime_ns = 0
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        total_size += st.st_size
+        latest_mtime_ns = max(latest_mtime_ns, st.st_mtime_ns)
+    return total_size, latest_mtime_ns
@@ -0,0 +1,262 @@
+import os
+import struct
+from .exiftool import read_file_tags
+
+# 안쪽 box까지 내려가서 읽는 container box
+CONTAINER_BOXES = {b"moov", b"trak", b"mdia", b"minf", b"stbl", b"edts"}
+# moov가 비정상적으로 크면 (손상된 파일 등) 읽지 않음
+MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+
+class MovParseError(Exception):
+    pass
+
+
+def _iter_boxes(data, start=0, end=None):
+    """data[start:end] 안의 box를 (type, payload_start, payload_end) 로 반환"""
+    end = len(data) if end is None else end
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[pos:pos + 8])
+        header_size = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", data[pos + 8:pos + 16])
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size or pos + size > end:
+            break
+        yield box_type, pos + header_size, pos + size
+        pos += size
+
+
+def _find_moov(f):
+    """파일의 최상위 box를 seek로 건너뛰며 moov payload만 읽음 (mdat은 읽지 않음)"""
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    pos = 0
+    while pos + 8 <= file_size:
+        f.seek(pos)
+        header = f.read(16)
+        if len(header) < 8:
+            break
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_size = 8
+        if size == 1:
+            (size,) = struct.unpack(">Q", header[8:16])
+            header_size = 16
+        elif size == 0:
+            size = file_size - pos
+        if size < header_size:
+            raise MovParseError(f"Invalid box size at {pos}")
+        if box_type == b"moov":
+            payload_size = size - header_size
+            if payload_size > MAX_MOOV_SIZE:
+                raise MovParseError("moov box too large")
+            f.seek(pos + header_size)
+            return f.read(payload_size)
+        pos += size
+    raise MovParseError("moov box not found")
+
+
+def _parse_time_header(payload):
+    # mvhd / mdhd: (timescale, duration)
+    if len(payload) < 20:
+        raise MovParseError(f"Truncated time header ({len(payload)} bytes)")
+    version = payload[0]
+    if version == 1:
+        if len(payload) < 32:
+            raise MovParseError(f"Truncated version 1 time header ({len(payload)} bytes)")
+        timescale, duration = struct.unpack(">IQ", payload[20:32])
+    else:
+        timescale, duration = struct.unpack(">II", payload[12:20])
+    return timescale, duration
+
+
+def _parse_stsd(payload, handler):
+    (entry_count,) = struct.unpack(">I", payload[4:8])
+    if not entry_count:
+        return {}
+    entry_size, fmt = struct.unpack(">I4s", payload[8:16])
+    entry = payload[16:8 + entry_size]
+    info = {"format": fmt.decode("latin-1")}
+    if handler == b"vide" and len(entry) >= 70:
+        width, height = struct.unpack(">HH", entry[24:28])
+        name_len = entry[42]
+        info.update({
+            "width": width,
+            "height": height,
+            "compressor_name": entry[43:43 + min(name_len, 31)].decode("latin-1", "replace"),
+            "depth": struct.unpack(">H", entry[74:76])[0] if len(entry) >= 76 else None,
+        })
+    elif handler == b"tmcd" and len(entry) >= 25:
+        flags, timescale, frame_duration, number_of_frames = struct.unpack(">IIIB", entry[12:25])
+        info.update({
+            "drop_frame": bool(flags & 0x1),
+            "timescale": timescale,
+            "frame_duration": frame_duration,
+            "number_of_frames": number_of_frames,
+        })
+    return info
+
+
+def _parse_stts(payload):
+    (entry_count,) = struct.unpack(">I", payload[4:8])
+    entries = [struct.unpack(">II", payload[8 + i * 8:16 + i * 8]) for i in range(entry_count)]
+    return entries
+
+
+def _parse_chunk_offsets(box_type, payload):
+    (entry_count,) = struct.unpack(">I", payload[4:8])
+    if not entry_count:
+        return []
+    if box_type == b"co64":
+        return [struct.unpack(">Q", payload[8:16])[0]]
+    return [struct.unpack(">I", payload[8:12])[0]]
+
+
+def _parse_track(data, start, end):
+    track = {}
+    boxes = {}
+
+    def collect(s, e):
+        for box_type, p_start, p_end in _iter_boxes(data, s, e):
+            if box_type in CONTAINER_BOXES:
+                collect(p_start, p_end)
+            else:
+                boxes.setdefault(box_type, data[p_start:p_end])
+
+    collect(start, end)
+    if b"hdlr" in boxes:
+        track["handler"] = boxes[b"hdlr"][8:12]
+    if b"mdhd" in boxes:
+        track["timescale"], track["duration"] = _parse_time_header(boxes[b"mdhd"])
+    if b"stsd" in boxes:
+        track["sample"] = _parse_stsd(boxes[b"stsd"], track.get("handler"))
+    if b"stts" in boxes:
+        track["stts"] = _parse_stts(boxes[b"stts"])
+    for box_type in (b"stco", b"co64"):
+        if box_type in boxes:
+            track["chunk_offsets"] = _parse_chunk_offsets(box_type, boxes[box_type])
+    return track
+
+
+def _frames_to_timecode(frame_number, fps, drop_frame):
+    if drop_frame and fps in (30, 60):
+        # drop-frame: 10분 단위가 아닌 매 분마다 프레임 번호 2개(60fps는 4개) 건너뜀
+        drop = fps // 15
+        frames_per_10min = fps * 600 - drop * 9
+        frames_per_min = fps * 60 - drop
+        tens, rest = divmod(frame_number, frames_per_10min)
+        if rest > drop:
+            frame_number += drop * 9 * tens + drop * ((rest - drop) // frames_per_min)
+        else:
+            frame_number += drop * 9 * tens
+    frames = frame_number % fps
+    seconds = (frame_number // fps) % 60
+    minutes = (frame_number // (fps * 60)) % 60
+    hours = (frame_number // (fps * 3600)) % 24
+    sep = ";" if drop_frame else ":"
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{sep}{frames:02d}"
+
+
+def _read_start_timecode(f, track):
+    sample = track.get("sample", {})
+    offsets = track.get("chunk_offsets")
+    fps = sample.get("number_of_frames")
+    if not offsets or not fps:
+        return None
+    f.seek(offsets[0])
+    raw = f.read(4)
+    if len(raw) != 4:
+        return None
+    (frame_number,) = struct.unpack(">i", raw)
+    return _frames_to_timecode(frame_number, fps, sample.get("drop_frame", False))
+
+
+def read_mov_info(path):
+    """
+    MOV(QuickTime / ISO-BMFF) 파일의 moov box만 읽어서 영상 정보 추출
+    Returns:
+        dict: codec, compressor_name, width, height, frame_rate, duration, frame_count, timecode ...
+    """
+    with open(path, "rb") as f:
+        moov = _find_moov(f)
+        info = {}
+        video = None
+        timecode_track = None
+        for box_type, p_start, p_end in _iter_boxes(moov):
+            if box_type == b"mvhd":
+                timescale, duration = _parse_time_header(moov[p_start:p_end])
+                info["timescale"] = timescale
+                info["duration"] = duration / timescale if timescale else 0
+            elif box_type == b"trak":
+                track = _parse_track(moov, p_start, p_end)
+                if track.get("handler") == b"vide" and video is None:
+                    video = track
+                elif track.get("handler") == b"tmcd" and timecode_track is None:
+                    timecode_track = track
+
+        if video:
+            sample = video.get("sample", {})
+            stts = video.get("stts", [])
+            frame_count = sum(count for count, _ in stts)
+            info.update({
+                "codec": sample.get("format"),
+                "compressor_name": sample.get("compressor_name"),
+                "width": sample.get("width"),
+                "height": sample.get("height"),
+                "depth": sample.get("depth"),
+                "frame_count": frame_count,
+            })
+            if stts and video.get("timescale"):
+                # 가장 많이 쓰인 sample delta 기준 frame rate
+                _, delta = max(stts, key=lambda entry: entry[0])
+                if delta:
+                    info["frame_rate"] = video["timescale"] / delta
+        if timecode_track:
+            info["timecode"] = _read_start_timecode(f, timecode_track)
+    return info
+
+
+def _format_duration(seconds):
+    # exiftool Duration 표기 방식
+    if seconds < 30:
+        return f"{seconds:.2f} s"
+    seconds = int(round(seconds))
+    return f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def read_mov_metadata(path):
+    """
+    exiftool -json 결과와 같은 키를 갖는 MOV 메타데이터 (subprocess 없음)
+    Returns:
+        dict: meta dict, 파싱 실패 시 None (exiftool로 대체)
+    """
+    try:
+        info = read_mov_info(path)
+    except (OSError, MovParseError, struct.error, IndexError, ValueError) as e:
+        # 손상된 파일 하나 때문에 스캔 전체가 멈추지 않도록 exiftool로 대체
+        print(f"[WARN] MOV atom read failed, fallback to exiftool: {e}")
+        return None
+    if not info.get("codec"):
+        print(f"[INFO] No video track found, fallback to exiftool: {path}")
+        return None
+
+    meta = dict(read_file_tags(path))
+    meta.update({
+        "Duration": _format_duration(info.get("duration", 0)),
+        "TimeScale": info.get("timescale"),
+        "CompressorID": info["codec"],
+        "CompressorName": info.get("compressor_name"),
+        "ImageWidth": info.get("width"),
+        "ImageHeight": info.get("height"),
+        "ImageSize": f"{info.get('width')}x{info.get('height')}",
+        "BitDepth": info.get("depth"),
+        "FrameCount": info.get("frame_count"),
+    })
+    if "frame_rate" in info:
+        meta["VideoFrameRate"] = round(info["frame_rate"], 3)
+    if info.get("timecode"):
+        meta["TimeCode"] = info["timecode"]
+    return meta
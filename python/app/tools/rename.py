@@ -1,5 +1,5 @@
 import os
-import pyseq
+from .sequence_scanner import walk
 import shutil
 
 def rename_sequence(seq_path, new_path):
@@ -11,7 +11,7 @@ def rename_sequence(seq_path, new_path):
     typ = parts[-2]       # "org"
     ver = parts[-1]       # "v001"
 
-    for root, dirs, seqs in pyseq.walk(seq_path):
+    for root, dirs, seqs in walk(seq_path):
         for seq in seqs:
             ext = os.path.splitext(seq[0].path)[1]  # ex: ".exr"
             for frame in seq:
@@ -0,0 +1,243 @@
+import os
+import re
+
+# head + 프레임 번호 + 확장자 ex) A001C003_240101.1001.exr -> ("A001C003_240101.", "1001", ".exr")
+FRAME_RE = re.compile(r"^(.*?)(\d+)(\.[^.]+)?$")
+
+
+class Frame(object):
+    """시퀀스의 프레임 하나 (pyseq.Item 에서 쓰던 path / frame 만 제공)"""
+    __slots__ = ("path", "frame")
+
+    def __init__(self, path, frame):
+        self.path = path
+        self.frame = frame
+
+    @property
+    def name(self):
+        return os.path.basename(self.path)
+
+    def __repr__(self):
+        return f"<Frame {self.path}>"
+
+
+class Sequence(object):
+    """
+    scandir 결과로 만든 frame sequence
+    프레임 객체를 미리 만들지 않고 (directory, head, tail, padding, 프레임 번호 리스트)만 저장
+    pyseq.Sequence 에서 쓰던 API(head, tail, start, end, format, missing, 인덱싱/순회) 호환
+    """
+    __slots__ = ("directory", "_head", "_tail", "padding", "frames", "_name")
+
+    def __init__(self, directory, head, tail, padding, frames, name=None):
+        self.directory = directory
+        self._head = head
+        self._tail = tail
+        self.padding = padding
+        self.frames = sorted(frames)
+        self._name = name
+
+    @property
+    def name(self):
+        # 단일 파일이면 파일 이름 그대로, 시퀀스면 head + tail
+        if self._name is not None:
+            return self._name
+        return f"{self._head}{self._tail}"
+
+    def head(self):
+        return self._head
+
+    def tail(self):
+        return self._tail
+
+    def start(self):
+        return self.frames[0] if self.frames else None
+
+    def end(self):
+        return self.frames[-1] if self.frames else None
+
+    def length(self):
+        return len(self.frames)
+
+    def pad_format(self):
+        if self.padding > 1:
+            return f"%0{self.padding}d"
+        return "%d"
+
+    def format(self, fmt="%h%p%t %R"):
+        """
+        pyseq 형식 지정자 일부 지원
+        %h head, %t tail, %p padding(ex: %04d), %s start, %e end, %l length, %r range, %R 전체 범위, %m missing
+        """
+        missing = self.missing()
+        replacements = {
+            "%h": self._head,
+            "%t": self._tail,
+            "%p": self.pad_format(),
+            "%s": str(self.start()),
+            "%e": str(self.end()),
+            "%l": str(self.length()),
+            "%r": f"{self.start()}-{self.end()}",
+            "%R": self._frame_ranges(),
+            "%m": f"[{', '.join(str(frame) for frame in missing)}]",
+        }
+        return re.sub(r"%[htpselrRm]", lambda m: replacements[m.group(0)], fmt)
+
+    def _frame_ranges(self):
+        ranges = []
+        for first, last in self.contiguous_ranges():
+            ranges.append(str(first) if first == last else f"{first}-{last}")
+        return "[" + ", ".join(ranges) + "]"
+
+    def contiguous_ranges(self):
+        """[(first, last), ...] 빠진 프레임 기준으로 나눈 연속 구간"""
+        ranges = []
+        for frame in self.frames:
+            if ranges and frame == ranges[-1][1] + 1:
+                ranges[-1][1] = frame
+            else:
+                ranges.append([frame, frame])
+        return [tuple(r) for r in ranges]
+
+    def missing(self):
+        if not self.frames:
+            return []
+        present = set(self.frames)
+        return [frame for frame in range(self.frames[0], self.frames[-1] + 1) if frame not in present]
+
+    def frame_name(self, frame):
+        if self._name is not None and len(self.frames) == 1:
+            return self._name
+        return f"{self._head}{self.pad_format() % frame}{self._tail}"
+
+    def frame_path(self, frame):
+        return os.path.join(self.directory, self.frame_name(frame))
+
+    def path(self):
+        # 시퀀스 패턴 경로 ex) .../A001C003_240101.%04d.exr
+        if self._name is not None:
+            return os.path.join(self.directory, self._name)
+        return os.path.join(self.directory, self.format("%h%p%t"))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [Frame(self.frame_path(frame), frame) for frame in self.frames[idx]]
+        frame = self.frames[idx]
+        return Frame(self.frame_path(frame), frame)
+
+    def __iter__(self):
+        for frame in self.frames:
+            yield Frame(self.frame_path(frame), frame)
+
+    def __str__(self):
+        if self._name is not None:
+            return self._name
+        return self.format("%h%r%t")
+
+    def __repr__(self):
+        return f"<Sequence {self}>"
+
+
+def _is_padded(digits):
+    return len(digits) > 1 and digits[0] == "0"
+
+
+def _split_padding(entries):
+    """
+    head / tail 이 같은 (digits, 파일 이름) 들을 padding 별 시퀀스로 나눔
+    0으로 시작하는 번호는 자릿수가 곧 padding (A.001.exr 와 A.0002.exr 은 다른 시퀀스)
+    0으로 시작하지 않는 번호는 자릿수 이하의 가장 큰 padding 에 포함 (A.0999.exr, A.1000.exr, A.10000.exr 은 %04d)
+    Returns:
+        list: (padding, 프레임 번호 리스트, 첫 파일 이름) 리스트
+    """
+    paddings = sorted({len(digits) for digits, _ in entries if _is_padded(digits)})
+    split = {}
+    for digits, name in entries:
+        if _is_padded(digits):
+            padding = len(digits)
+        else:
+            # 맞는 padding 이 없으면 0으로 채우지 않은 번호끼리 한 시퀀스
+            padding = next((p for p in reversed(paddings) if p <= len(digits)), 0)
+        group = split.get(padding)
+        if group is None:
+            group = split[padding] = [[], len(digits), name]
+        group[0].append(int(digits))
+        group[1] = min(group[1], len(digits))
+    # 0으로 채우지 않은 시퀀스는 가장 짧은 자릿수를 padding 으로 기록 (한 자리면 %d)
+    return [(padding or min_len, frames, first_name) for padding, (frames, min_len, first_name) in split.items()]
+
+
+def scan(directory, names=None):
+    """
+    directory 하나의 파일 이름들을 sequence 단위로 묶음
+    Args:
+        directory: 대상 폴더
+        names: 파일 이름 리스트 (없으면 scandir 로 읽음)
+    Returns:
+        list: 이름순으로 정렬된 Sequence 리스트
+    """
+    if names is None:
+        with os.scandir(directory) as it:
+            names = [entry.name for entry in it if not entry.is_dir()]
+
+    groups = {}
+    singles = []
+    for name in names:
+        match = FRAME_RE.match(name)
+        if not match:
+            singles.append(name)
+            continue
+        head, digits, tail = match.groups()
+        groups.setdefault((head, tail or ""), []).append((digits, name))
+
+    seqs = []
+    for (head, tail), entries in groups.items():
+        for padding, frames, first_name in _split_padding(entries):
+            if len(frames) == 1:
+                # 프레임이 하나뿐이면 파일 이름을 그대로 name 으로 사용 (ex: A001C003.mov)
+                seqs.append(Sequence(directory, head, tail, padding, frames, name=first_name))
+            else:
+                seqs.append(Sequence(directory, head, tail, padding, frames))
+    for name in singles:
+        seqs.append(Sequence(directory, name, "", 0, [0], name=name))
+
+    seqs.sort(key=lambda seq: (seq.name, seq.padding))
+    return seqs
+
+
+def walk(top, topdown=True):
+    """
+    pyseq.walk 대체, os.scandir 기반 (파일마다 stat 하지 않음)
+    Yields:
+        (root, dirs, seqs): dirs 를 수정하면 하위 폴더 순회를 제어할 수 있음 (topdown=True 일 때)
+    """
+    try:
+        with os.scandir(top) as it:
+            dirs = []
+            names = []
+            for entry in it:
+                # os.walk처럼 폴더 symlink는 따라가지 않음 (manifest._scan과 같은 기준)
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_dir_link = not is_dir and entry.is_symlink() and entry.is_dir()
+                except OSError:
+                    is_dir = is_dir_link = False
+                if is_dir:
+                    dirs.append(entry.name)
+                elif not is_dir_link:
+                    names.append(entry.name)
+    except OSError as e:
+        print(f"[WARN] Cannot scan directory {top}: {e}")
+        return
+
+    dirs.sort()
+    seqs = scan(top, names)
+    if topdown:
+        yield top, dirs, seqs
+    for name in dirs:
+        yield from walk(os.path.join(top, name), topdown)
+    if not topdown:
+        yield top, dirs, seqs
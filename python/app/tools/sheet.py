@@ -0,0 +1,214 @@
+import os
+import threading
+from collections import OrderedDict
+from openpyxl import load_workbook
+from .sheet_store import read_sheet_sidecar, write_sheet_sidecar
+from .version_store import load_stored_version
+
+# 메모리에 유지할 xlsx 버전 수
+MAX_CACHED_SHEETS = 4
+
+
+def normalize_value(value):
+    # 빈 셀은 "", list인 meta data는 str로 (xlsx 저장과 같은 규칙)
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return value
+
+
+class Sheet(object):
+    """
+    xlsx 한 버전의 데이터, 열(header) 단위 리스트로 보관
+    테이블, 체크박스 검증, publish 가 같은 Sheet 객체를 공유
+    """
+
+    def __init__(self, headers=None, rows=None, path=None):
+        self.headers = []
+        self.columns = {}
+        self.path = path
+        self._row_count = 0
+        for header in headers or []:
+            self.add_column(header)
+        for row in rows or []:
+            self.append_row(row)
+
+    def __len__(self):
+        return self._row_count
+
+    @property
+    def row_count(self):
+        return self._row_count
+
+    def add_column(self, header, default=""):
+        if header in self.columns:
+            return
+        self.headers.append(header)
+        self.columns[header] = [default] * self._row_count
+
+    def append_row(self, row):
+        """
+        Args:
+            row: {header: value} dict 또는 headers 순서의 값 리스트
+        """
+        if isinstance(row, dict):
+            for key in row:
+                if key not in self.columns:
+                    self.add_column(key)
+            for header in self.headers:
+                self.columns[header].append(normalize_value(row.get(header, "")))
+        else:
+            values = list(row) + [""] * (len(self.headers) - len(row))
+            for header, value in zip(self.headers, values):
+                self.columns[header].append(normalize_value(value))
+        self._row_count += 1
+        return self._row_count - 1
+
+    def value(self, row, header, default=""):
+        column = self.columns.get(header)
+        if column is None:
+            return default
+        return column[row]
+
+    def set_value(self, row, header, value):
+        if header not in self.columns:
+            self.add_column(header)
+        self.columns[header][row] = normalize_value(value)
+
+    def row(self, row):
+        return {header: self.columns[header][row] for header in self.headers}
+
+    def column(self, header):
+        return self.columns.get(header, [])
+
+    def iter_rows(self, headers=None):
+        """headers 순서의 값 리스트를 한 행씩 반환"""
+        columns = [self.columns[header] for header in (headers or self.headers)]
+        for row in range(self._row_count):
+            yield [column[row] for column in columns]
+
+    def copy(self):
+        sheet = Sheet(path=self.path)
+        sheet.headers = list(self.headers)
+        sheet.columns = {header: list(values) for header, values in self.columns.items()}
+        sheet._row_count = self._row_count
+        return sheet
+
+    @classmethod
+    def from_columns(cls, headers, columns, path=None):
+        sheet = cls(path=path)
+        sheet.headers = list(headers)
+        sheet.columns = columns
+        sheet._row_count = len(columns[headers[0]]) if headers else 0
+        return sheet
+
+    @classmethod
+    def from_xlsx(cls, xlsx_path):
+        wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            rows = ws.iter_rows(values_only=True)
+            # 같은 header가 두 번 나오면 (예전 xlsx의 thumbnail_path) 첫 번째 열만 사용
+            positions = {}
+            for position, header in enumerate(next(rows, ())):
+                if header is not None and header not in positions:
+                    positions[header] = position
+            headers = list(positions)
+            sheet = cls(headers, path=xlsx_path)
+            blank_rows = 0
+            for values in rows:
+                values = [values[i] if i < len(values) else None for i in positions.values()]
+                # 빈 행은 뒤에 값이 있는 행이 나올 때만 추가 (끝쪽 빈 행 제외, 행 번호 유지)
+                if all(value is None for value in values):
+                    blank_rows += 1
+                    continue
+                for _ in range(blank_rows):
+                    sheet.append_row([])
+                blank_rows = 0
+                sheet.append_row(values)
+        finally:
+            wb.close()
+        return sheet
+
+
+_sheet_cache = OrderedDict()
+_sheet_cache_lock = threading.Lock()
+
+
+def read_sheet(xlsx_path):
+    """
+    sidecar(.sheet.db)가 xlsx와 같은 버전이면 sidecar에서, 아니면 xlsx에서 읽음
+    xlsx에서 읽은 경우 다음 읽기를 위해 sidecar를 다시 만듦
+    xlsx가 없으면 (히스토리에만 저장된 버전) 버전 히스토리에서 복원
+    """
+    if not os.path.exists(xlsx_path):
+        stored = load_stored_version(xlsx_path)
+        if stored is None:
+            raise FileNotFoundError(f"List version not found: {xlsx_path}")
+        headers, rows = stored
+        return Sheet(headers, rows, path=xlsx_path)
+
+    stored = read_sheet_sidecar(xlsx_path)
+    if stored is not None:
+        headers, columns = stored
+        return Sheet.from_columns(headers, columns, path=xlsx_path)
+
+    sheet = Sheet.from_xlsx(xlsx_path)
+    try:
+        write_sheet_sidecar(xlsx_path, sheet)
+    except Exception as e:
+        print(f"[WARN] Sheet sidecar write failed: {e}")
+    return sheet
+
+
+def _sheet_stamp(path):
+    # 히스토리에만 있는 버전은 바뀌지 않으므로 고정 stamp
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ("history",)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def get_cached_sheet(xlsx_path):
+    """메모리에 있고 파일이 바뀌지 않은 Sheet만 반환 (없으면 None, 새로 읽지 않음)"""
+    key = os.path.abspath(xlsx_path)
+    stamp = _sheet_stamp(key)
+    with _sheet_cache_lock:
+        cached = _sheet_cache.get(key)
+        if cached and cached[0] == stamp:
+            return cached[1]
+    return None
+
+
+def cache_sheet(xlsx_path, sheet):
+    """방금 저장한 xlsx의 Sheet를 캐시에 넣음 (다음 load_sheet에서 다시 읽지 않음)"""
+    key = os.path.abspath(xlsx_path)
+    stamp = _sheet_stamp(key)
+    with _sheet_cache_lock:
+        _sheet_cache[key] = (stamp, sheet)
+        _sheet_cache.move_to_end(key)
+        while len(_sheet_cache) > MAX_CACHED_SHEETS:
+            _sheet_cache.popitem(last=False)
+
+
+def load_sheet(xlsx_path):
+    """
+    xlsx를 Sheet로 읽음, 파일이 바뀌지 않았으면 (mtime_ns, size) 메모리에 있는 Sheet 반환
+    """
+    key = os.path.abspath(xlsx_path)
+    stamp = _sheet_stamp(key)
+    with _sheet_cache_lock:
+        cached = _sheet_cache.get(key)
+        if cached and cached[0] == stamp:
+            _sheet_cache.move_to_end(key)
+            return cached[1]
+
+    sheet = read_sheet(xlsx_path)
+    with _sheet_cache_lock:
+        _sheet_cache[key] = (stamp, sheet)
+        _sheet_cache.move_to_end(key)
+        while len(_sheet_cache) > MAX_CACHED_SHEETS:
+            _sheet_cache.popitem(last=False)
+    return sheet
@@ -0,0 +1,148 @@
+from .sheet import load_sheet
+
+KEY_HEADER = "Directory"
+# 버전 비교에서 무시하는 열 (파일을 읽기만 해도 바뀌는 값, 썸네일 이미지 자리)
+DEFAULT_IGNORE = ("thumbnail", "FileAccessDate", "FileInodeChangeDate")
+
+
+class SheetDiff(object):
+    """
+    두 Sheet의 차이
+    added:    새 Sheet의 행 번호 (0부터)
+    removed:  이전 Sheet의 행 번호
+    modified: (이전 행 번호, 새 행 번호, 바뀐 열 리스트)
+    added_columns / removed_columns: 열 이름 리스트
+    changed_columns: 바뀐 행에서 값이 달라진 열 전체
+    """
+
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.modified = []
+        self.added_columns = []
+        self.removed_columns = []
+
+    @property
+    def changed_columns(self):
+        columns = []
+        for _, _, headers in self.modified:
+            columns.extend(header for header in headers if header not in columns)
+        return columns
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.modified or self.added_columns or self.removed_columns)
+
+    def summary(self):
+        return (
+            f"Added rows: {len(self.added)}, Removed rows: {len(self.removed)}, "
+            f"Modified rows: {len(self.modified)}\n"
+            f"Added columns: {', '.join(self.added_columns) or '-'}\n"
+            f"Removed columns: {', '.join(self.removed_columns) or '-'}\n"
+            f"Changed columns: {', '.join(self.changed_columns) or '-'}"
+        )
+
+    def __repr__(self):
+        return (f"SheetDiff(added={len(self.added)}, removed={len(self.removed)}, "
+                f"modified={len(self.modified)}, columns=+{len(self.added_columns)}/-{len(self.removed_columns)})")
+
+
+def _normalized_rows(sheet, headers):
+    """headers(두 Sheet의 열 합집합) 순서의 값 tuple 리스트, 없는 열은 "" (열이 새로 생겨도 빈 행은 같음)"""
+    empty = [""] * len(sheet)
+    columns = [sheet.columns.get(header, empty) for header in headers]
+    return list(zip(*columns)) if columns else [()] * len(sheet)
+
+
+def _row_keys(sheet):
+    """(Directory, 같은 Directory 안에서의 순서), Directory 열이 없으면 None"""
+    if KEY_HEADER not in sheet.columns:
+        return None
+    seen = {}
+    keys = []
+    for directory in sheet.column(KEY_HEADER):
+        index = seen.get(directory, 0)
+        seen[directory] = index + 1
+        keys.append((directory, index))
+    return keys
+
+
+def diff_sheets(old, new, ignore=DEFAULT_IGNORE):
+    """
+    행마다 정규화한 값 tuple의 hash를 한 번씩 계산해서 비교 (O(행 수))
+    Directory 열이 있으면 Directory 기준으로 행을 짝지어 modified를 구하고,
+    없으면 같은 hash의 행끼리 짝지음 (이 경우 modified는 added + removed로 나옴)
+    Returns:
+        SheetDiff
+    """
+    diff = SheetDiff()
+    old_headers = [header for header in old.headers if header not in ignore]
+    new_headers = [header for header in new.headers if header not in ignore]
+    diff.added_columns = [header for header in new_headers if header not in old.columns]
+    diff.removed_columns = [header for header in old_headers if header not in new.columns]
+
+    headers = list(dict.fromkeys(old_headers + new_headers))
+    old_rows = _normalized_rows(old, headers)
+    new_rows = _normalized_rows(new, headers)
+    old_hashes = list(map(hash, old_rows))
+    new_hashes = list(map(hash, new_rows))
+
+    old_keys = _row_keys(old)
+    new_keys = _row_keys(new)
+    if old_keys is not None and new_keys is not None:
+        old_index = {key: row for row, key in enumerate(old_keys)}
+        matched = set()
+        for new_row, key in enumerate(new_keys):
+            old_row = old_index.get(key)
+            if old_row is None:
+                diff.added.append(new_row)
+                continue
+            matched.add(old_row)
+            if old_hashes[old_row] != new_hashes[new_row] or old_rows[old_row] != new_rows[new_row]:
+                # hash가 다른 행만 열 단위로 비교
+                changed = [header for header, before, after in zip(headers, old_rows[old_row], new_rows[new_row])
+                           if before != after]
+                diff.modified.append((old_row, new_row, changed))
+        diff.removed = [row for row in range(len(old)) if row not in matched]
+        return diff
+
+    # key 열이 없으면 hash가 같은 행끼리 짝지음
+    remaining = {}
+    for old_row, digest in enumerate(old_hashes):
+        remaining.setdefault(digest, []).append(old_row)
+    for new_row, digest in enumerate(new_hashes):
+        rows = remaining.get(digest)
+        if rows:
+            rows.pop(0)
+        else:
+            diff.added.append(new_row)
+    diff.removed = sorted(row for rows in remaining.values() for row in rows)
+    return diff
+
+
+def diff_versions(old_xlsx_path, new_xlsx_path, ignore=DEFAULT_IGNORE):
+    """
+    두 list 버전 비교 (load_sheet 사용: 메모리 캐시 / sidecar / 히스토리, xlsx 파싱 없음)
+    Returns:
+        SheetDiff
+    """
+    return diff_sheets(load_sheet(old_xlsx_path), load_sheet(new_xlsx_path), ignore)
+
+
+def format_diff(diff, old, new, limit=200):
+    """SheetDiff를 사람이 읽을 수 있는 줄 단위 문자열로 (행 번호는 xlsx 기준, 2부터)"""
+
+    def label(sheet, row):
+        directory = sheet.value(row, KEY_HEADER)
+        return f"row {row + 2}" + (f" ({directory})" if directory else "")
+
+    lines = []
+    for row in diff.added:
+        lines.append(f"+ {label(new, row)}")
+    for row in diff.removed:
+        lines.append(f"- {label(old, row)}")
+    for old_row, new_row, headers in diff.modified:
+        changes = ", ".join(f"{h}: {old.value(old_row, h)!r} -> {new.value(new_row, h)!r}" for h in headers)
+        lines.append(f"~ {label(new, new_row)}: {changes}")
+    if len(lines) > limit:
+        lines = lines[:limit] + [f"... {len(lines) - limit} more"]
+    return "\n".join(lines)
@@ -0,0 +1,98 @@
+import os
+from openpyxl import load_workbook
+from .sheet import normalize_value, get_cached_sheet, load_sheet
+from .sheet_store import read_sidecar_rows
+
+# xlsx 1행은 header, 데이터 행 번호 0 == xlsx 2행
+FIRST_DATA_ROW = 2
+
+
+def _header_positions(header_row):
+    # 같은 header가 여러 번 있으면 첫 번째 열 (Sheet.from_xlsx 와 같은 규칙)
+    positions = {}
+    for position, header in enumerate(header_row):
+        if header is not None and header not in positions:
+            positions[header] = position
+    return positions
+
+
+def _iter_xlsx_rows(xlsx_path, headers, rows):
+    """
+    read-only workbook에서 header 위치를 한 번만 찾고 필요한 열/행만 반환
+    rows가 있으면 그 범위 밖의 행은 cell을 만들지 않고, 마지막 행 이후는 읽지 않음
+    """
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        ws = wb.active
+        header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        positions = _header_positions(header_row)
+        headers = [header for header in headers if header in positions]
+        indices = [positions[header] for header in headers]
+        yield headers
+
+        wanted = None
+        min_row, max_row = FIRST_DATA_ROW, None
+        if rows is not None:
+            wanted = set(rows)
+            if not wanted:
+                return
+            min_row = min(wanted) + FIRST_DATA_ROW
+            max_row = max(wanted) + FIRST_DATA_ROW
+
+        blank = []
+        for row, values in enumerate(ws.iter_rows(min_row=min_row, max_row=max_row, values_only=True),
+                                     start=min_row - FIRST_DATA_ROW):
+            if wanted is not None and row not in wanted:
+                continue
+            record = (row, tuple(
+                normalize_value(values[i]) if i < len(values) else "" for i in indices
+            ))
+            # 빈 행은 뒤에 값이 있는 행이 나올 때만 반환 (끝쪽 빈 행 제외)
+            if all(value == "" for value in record[1]):
+                blank.append(record)
+                continue
+            yield from blank
+            blank = []
+            yield record
+    finally:
+        wb.close()
+
+
+def read_projection(xlsx_path, headers, rows=None):
+    """
+    xlsx의 일부 열(과 행)만 읽음
+    메모리에 있는 Sheet -> sidecar -> read-only xlsx 순서로 사용 (xlsx가 없으면 버전 히스토리)
+
+    Args:
+        headers: 읽을 열 이름 리스트
+        rows: 읽을 데이터 행 번호 (0부터, None이면 전체)
+    Returns:
+        (headers, records): headers는 실제로 있는 열만, records는 (row, 값 tuple) 리스트
+    """
+    if rows is not None:
+        rows = sorted(row for row in set(rows) if row >= 0)
+
+    sheet = get_cached_sheet(xlsx_path)
+    if sheet is None and not os.path.exists(xlsx_path):
+        # 히스토리에만 있는 버전은 복원해서 사용
+        sheet = load_sheet(xlsx_path)
+    if sheet is not None:
+        headers = [header for header in headers if header in sheet.columns]
+        row_ids = range(len(sheet)) if rows is None else [row for row in rows if row < len(sheet)]
+        return headers, [(row, tuple(sheet.value(row, header) for header in headers)) for row in row_ids]
+
+    stored = read_sidecar_rows(xlsx_path, headers, rows)
+    if stored is not None:
+        return stored
+
+    records = _iter_xlsx_rows(xlsx_path, headers, rows)
+    headers = next(records)
+    return headers, list(records)
+
+
+def read_column(xlsx_path, header):
+    """한 열의 값 리스트, 열이 없으면 ValueError"""
+    headers, records = read_projection(xlsx_path, [header])
+    if header not in headers:
+        raise ValueError(f"'{header}' column not found in {xlsx_path}")
+    return [values[0] for _, values in records]
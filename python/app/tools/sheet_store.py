@@ -0,0 +1,225 @@
+import os
+import sqlite3
+
+SIDECAR_SUFFIX = ".sheet.db"
+SCHEMA_VERSION = 1
+# SQLite bind parameter 제한보다 행이 많으면 전체를 읽고 걸러냄
+MAX_SQL_PARAMS = 900
+
+
+def get_sidecar_path(xlsx_path):
+    # {date}_list_v001.xlsx -> {date}_list_v001.sheet.db
+    return os.path.splitext(xlsx_path)[0] + SIDECAR_SUFFIX
+
+
+def _xlsx_stamp(xlsx_path):
+    st = os.stat(xlsx_path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _value_type(value):
+    if isinstance(value, (bool, int)):
+        return "integer"
+    if isinstance(value, float):
+        return "real"
+    return "text"
+
+
+def _merge_type(current, value):
+    # 열 전체가 정수면 integer, 실수가 섞이면 real, 그 외 text (빈 값은 무시)
+    if value == "" or value is None:
+        return current
+    new = _value_type(value)
+    if current is None or current == new:
+        return new
+    if {current, new} == {"integer", "real"}:
+        return "real"
+    return "text"
+
+
+def _to_sql(value):
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    # datetime 등은 xlsx 에서 보이는 문자열로
+    return str(value)
+
+
+class SheetDbWriter(object):
+    """
+    Sheet 형식의 SQLite 파일(sidecar, table export)을 행 단위로 기록
+    chunk_size 행마다 executemany 로 넘기므로 전체 행을 메모리에 모으지 않음
+    close() 때 임시 파일을 교체하므로 중간 상태의 파일이 보이지 않음
+    """
+
+    def __init__(self, path, headers, chunk_size=1000):
+        self.path = path
+        self.headers = list(headers)
+        self.chunk_size = chunk_size
+        self.row_count = 0
+        self._types = [None] * len(self.headers)
+        self._pending = []
+        self._tmp_path = path + ".tmp"
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        self._conn = sqlite3.connect(self._tmp_path)
+        self._conn.execute("CREATE TABLE info (key TEXT PRIMARY KEY, value)")
+        self._conn.execute("CREATE TABLE schema (position INTEGER PRIMARY KEY, header TEXT UNIQUE, type TEXT)")
+        # header 이름은 schema 테이블에만 두고 열 이름은 c0, c1 ... 으로 고정
+        column_defs = "".join(f", c{i}" for i in range(len(self.headers)))
+        self._conn.execute(f"CREATE TABLE rows (row_id INTEGER PRIMARY KEY{column_defs})")
+        placeholders = ", ".join("?" * (len(self.headers) + 1))
+        self._insert = f"INSERT INTO rows VALUES ({placeholders})"
+
+    def append(self, values):
+        values = list(values)[:len(self.headers)]
+        values += [""] * (len(self.headers) - len(values))
+        for i, value in enumerate(values):
+            self._types[i] = _merge_type(self._types[i], value)
+        self._pending.append([self.row_count] + [_to_sql(value) for value in values])
+        self.row_count += 1
+        if len(self._pending) >= self.chunk_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._conn.executemany(self._insert, self._pending)
+            self._pending = []
+
+    def close(self, info=None):
+        """
+        Args:
+            info: info 테이블에 추가로 기록할 {key: value}
+        """
+        if self._conn is None:
+            return
+        try:
+            self._flush()
+            entries = {"schema_version": SCHEMA_VERSION, "row_count": self.row_count}
+            entries.update(info or {})
+            self._conn.executemany("INSERT INTO info (key, value) VALUES (?, ?)", list(entries.items()))
+            self._conn.executemany(
+                "INSERT INTO schema (position, header, type) VALUES (?, ?, ?)",
+                [(i, header, self._types[i] or "text") for i, header in enumerate(self.headers)],
+            )
+            self._conn.commit()
+        finally:
+            self._conn.close()
+            self._conn = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        if self._conn is None:
+            return
+        self._conn.close()
+        self._conn = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def close_sheet_sidecar(writer, xlsx_path):
+    """행을 다 받은 sidecar SheetDbWriter를 저장이 끝난 xlsx의 mtime/size와 함께 닫음"""
+    mtime_ns, size = _xlsx_stamp(xlsx_path)
+    writer.close({"xlsx_mtime_ns": mtime_ns, "xlsx_size": size})
+    return writer.path
+
+
+def write_sheet_sidecar(xlsx_path, sheet):
+    """
+    xlsx와 같은 행을 SQLite sidecar로 저장 (xlsx는 사람이 보는 용도, 내부 읽기는 sidecar)
+    xlsx를 먼저 저장한 뒤 호출해야 함 (xlsx의 mtime/size를 같이 기록)
+    """
+    writer = SheetDbWriter(get_sidecar_path(xlsx_path), sheet.headers)
+    try:
+        for values in sheet.iter_rows():
+            writer.append(values)
+    except Exception:
+        writer.abort()
+        raise
+    return close_sheet_sidecar(writer, xlsx_path)
+
+
+def _open_current(xlsx_path):
+    """sidecar가 있고 xlsx와 같은 버전일 때만 connection 반환"""
+    sidecar_path = get_sidecar_path(xlsx_path)
+    if not os.path.exists(sidecar_path):
+        return None
+    conn = None
+    try:
+        conn = sqlite3.connect(f"file:{sidecar_path}?mode=ro", uri=True)
+        info = dict(conn.execute("SELECT key, value FROM info"))
+    except sqlite3.Error as e:
+        print(f"[WARN] Sheet sidecar unreadable, fallback to xlsx: {e}")
+        if conn is not None:
+            conn.close()
+        return None
+    # xlsx를 사람이 직접 수정했으면 (mtime/size가 다르면) sidecar는 쓰지 않음
+    if (info.get("schema_version") != SCHEMA_VERSION
+            or (info.get("xlsx_mtime_ns"), info.get("xlsx_size")) != _xlsx_stamp(xlsx_path)):
+        conn.close()
+        return None
+    return conn
+
+
+def read_sheet_headers(conn):
+    return [header for (header,) in conn.execute("SELECT header FROM schema ORDER BY position")]
+
+
+def read_sidecar_rows(xlsx_path, headers=None, rows=None):
+    """
+    sidecar에서 필요한 열/행만 읽음
+    Args:
+        headers: 읽을 열 (None이면 전체, 없는 열은 제외)
+        rows: 읽을 행 번호 (0부터, None이면 전체)
+    Returns:
+        (headers, records): records는 (row, 값 tuple) 리스트
+                            sidecar가 없거나 xlsx와 버전이 다르면 None
+    """
+    conn = _open_current(xlsx_path)
+    if conn is None:
+        return None
+    try:
+        all_headers = read_sheet_headers(conn)
+        if headers is None:
+            headers = all_headers
+        headers = [header for header in headers if header in all_headers]
+        select = ", ".join(["row_id"] + [f"c{all_headers.index(header)}" for header in headers])
+        query = f"SELECT {select} FROM rows"
+        params = ()
+        wanted = None
+        if rows is not None:
+            wanted = set(rows)
+            if len(wanted) <= MAX_SQL_PARAMS:
+                params = sorted(wanted)
+                query += f" WHERE row_id IN ({', '.join('?' * len(params))})"
+        records = conn.execute(query + " ORDER BY row_id", params).fetchall()
+        if wanted is not None and not params:
+            records = [record for record in records if record[0] in wanted]
+    except sqlite3.Error as e:
+        print(f"[WARN] Sheet sidecar read failed, fallback to xlsx: {e}")
+        return None
+    finally:
+        conn.close()
+    return headers, [
+        (record[0], tuple("" if value is None else value for value in record[1:]))
+        for record in records
+    ]
+
+
+def read_sheet_sidecar(xlsx_path, headers=None):
+    """
+    Args:
+        headers: 읽을 열 (None이면 전체)
+    Returns:
+        (headers, columns): columns는 {header: 값 리스트}
+                            sidecar가 없거나 xlsx와 버전이 다르면 None
+    """
+    stored = read_sidecar_rows(xlsx_path, headers)
+    if stored is None:
+        return None
+    headers, records = stored
+    values = list(zip(*(record for _, record in records)))
+    columns = {
+        header: list(values[position]) if records else []
+        for position, header in enumerate(headers)
+    }
+    return headers, columns
@@ -0,0 +1,127 @@
+import csv
+import os
+from .sheet_store import SheetDbWriter
+from .xlsx_writer import XlsxStreamWriter
+
+EXPORT_FORMATS = {
+    ".csv": "csv",
+    ".xlsx": "xlsx",
+    ".db": "sqlite",
+    ".sqlite": "sqlite",
+}
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class CsvTableWriter(object):
+    """csv 파일에 행 단위로 기록, chunk_size 행마다 writerows"""
+
+    def __init__(self, path, headers, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.path = path
+        self.headers = list(headers)
+        self.chunk_size = chunk_size
+        self.row_count = 0
+        self._pending = []
+        self._tmp_path = path + ".tmp"
+        # Excel에서 한글이 깨지지 않도록 BOM 포함
+        self._file = open(self._tmp_path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.headers)
+
+    def append(self, values):
+        self._pending.append(values)
+        self.row_count += 1
+        if len(self._pending) >= self.chunk_size:
+            self._writer.writerows(self._pending)
+            self._pending = []
+
+    def close(self):
+        if self._file is None:
+            return
+        self._writer.writerows(self._pending)
+        self._pending = []
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        os.remove(self._tmp_path)
+
+
+class XlsxTableWriter(object):
+    """XlsxStreamWriter 를 export 용으로 감쌈 (sidecar 없음)"""
+
+    def __init__(self, path, headers, chunk_size=DEFAULT_CHUNK_SIZE):
+        self._writer = XlsxStreamWriter(path, headers, sidecar=False)
+
+    @property
+    def row_count(self):
+        return self._writer.row_count
+
+    def append(self, values):
+        self._writer.append(values)
+
+    def close(self):
+        self._writer.close()
+
+    def abort(self):
+        self._writer.abort()
+
+
+_WRITERS = {
+    "csv": CsvTableWriter,
+    "xlsx": XlsxTableWriter,
+    "sqlite": SheetDbWriter,
+}
+
+
+def get_export_format(path):
+    """
+    Returns:
+        str: "csv" / "xlsx" / "sqlite", 모르는 확장자면 ValueError
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {ext} (use {', '.join(EXPORT_FORMATS)})")
+    return EXPORT_FORMATS[ext]
+
+
+def export_table(sheet, path, fmt=None, headers=None, chunk_size=DEFAULT_CHUNK_SIZE, should_stop=None, progress=None):
+    """
+    Sheet(테이블 model의 데이터)를 복사하지 않고 한 행씩 읽어서 파일로 기록
+    Args:
+        sheet: Sheet
+        path: 저장할 경로
+        fmt: "csv" / "xlsx" / "sqlite" (None이면 확장자로 결정)
+        headers: 저장할 열 (None이면 sheet.headers 전체)
+        chunk_size: 한 번에 파일로 넘기는 행 수
+        should_stop: True를 반환하면 중단 (임시 파일 삭제, 기존 파일 유지)
+        progress: chunk_size 행마다 progress(기록한 행 수, 전체 행 수) 호출
+    Returns:
+        int: 기록한 행 수, 중단되면 None
+    """
+    fmt = fmt or get_export_format(path)
+    headers = list(headers or sheet.headers)
+    writer = _WRITERS[fmt](path, headers, chunk_size=chunk_size)
+    total = len(sheet)
+    try:
+        for row, values in enumerate(sheet.iter_rows(headers), start=1):
+            writer.append(values)
+            if row % chunk_size == 0:
+                if should_stop and should_stop():
+                    writer.abort()
+                    print(f"[CANCEL] Table export stopped: {path}")
+                    return None
+                if progress:
+                    progress(row, total)
+    except Exception:
+        writer.abort()
+        raise
+    writer.close()
+    if progress:
+        progress(total, total)
+    print(f"[OK] Table exported to {path} ({writer.row_count} rows, {fmt})")
+    return writer.row_count
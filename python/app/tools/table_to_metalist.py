@@ -1,48 +1,77 @@
-from openpyxl import Workbook
-from openpyxl.drawing.image import Image
-from openpyxl.utils import get_column_letter
 import os
+from .export_metadata import rescan_changes
+from .manifest import build_manifest, write_manifest, is_manifest_current, load_manifest
+from .merge_scan import diff_directories
+from .sheet import load_sheet, cache_sheet
+from .version_index import mark_version_saved
+from .version_store import record_version
+from .xlsx_writer import XlsxStreamWriter
 
-def save_table_to_xlsx(table, save_path):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Metadata"
+def save_table_to_xlsx(sheet, save_path):
+    """
+    Args:
+        sheet: 테이블 model의 Sheet (편집 내용 포함)
+        save_path: 저장할 xlsx 경로
+    """
+    # checkbox 열은 model에만 있으므로 sheet.headers 그대로 사용
+    # 썸네일은 thumbnail_path 기준으로 표시 크기로 줄여서 삽입
+    with XlsxStreamWriter(save_path, sheet.headers) as writer:
+        for row_data in sheet.iter_rows():
+            writer.append(row_data)
 
-    column_count = table.columnCount()
-    row_count = table.rowCount()
-
-    # checkbox 열(0) 스킵
-    headers = []
-    for col in range(1, column_count):
-        headers.append(table.horizontalHeaderItem(col).text())
-    ws.append(headers)
+    print(f"[OK] Table saved to {save_path}")
 
-    for row in range(row_count):
-        row_data = []
-        for col in range(1, column_count):
-            item = table.item(row, col)
-            if item:
-                value = item.text()
-            else:
-                value = ""
-            row_data.append(value)
+def materialize_version(xlsx_path):
+    """
+    히스토리에만 저장된 버전을 xlsx로 만듦 (이미 xlsx가 있으면 그대로 사용)
+    Returns:
+        str: xlsx 경로
+    """
+    if os.path.exists(xlsx_path):
+        return xlsx_path
+    sheet = load_sheet(xlsx_path)
+    save_table_to_xlsx(sheet, xlsx_path)
+    return xlsx_path
 
-        ws.append(row_data)
+def save_sheet_version(sheet, xlsx_path, manifest):
+    """
+    스캔 결과 Sheet를 새 버전으로 저장 (xlsx + sidecar + manifest + 히스토리)
+    UI 스레드가 아닌 곳에서 호출해도 됨 (Qt 객체를 사용하지 않음)
+    저장한 Sheet는 캐시에 넣으므로 load_sheet가 xlsx를 다시 읽지 않음
+    """
+    save_table_to_xlsx(sheet, xlsx_path)
+    write_manifest(xlsx_path, manifest)
+    record_version(xlsx_path, sheet, manifest)
+    mark_version_saved(xlsx_path)
+    cache_sheet(xlsx_path, sheet)
+    return xlsx_path
 
-        # 썸네일 처리
-        if "thumbnail_path" in headers:
-            try:
-                thumb_col_idx = headers.index("thumbnail_path") + 1  # openpyxl 1부터 시작
-                thumbnail_path = table.item(row, thumb_col_idx).text()
-                if os.path.exists(thumbnail_path):
-                    img_col_letter = get_column_letter(headers.index("thumbnail") + 1)
-                    cell_ref = f"{img_col_letter}{row + 2}"  # +1(헤더) +1(1부터 시작)
-                    img = Image(thumbnail_path)
-                    img.width = 192
-                    img.height = 108
-                    ws.add_image(img, cell_ref)
-            except Exception as e:
-                print(f"[WARN] Thumbnail insert failed: {e}")
+def check_scan_folder(date_path, latest_xlsx_path):
+    """
+    Select 시 스캔 폴더를 최신 버전과 비교 (폴더 전체 stat + xlsx 읽기, UI 스레드가 아닌 곳에서 호출)
+    추출 / 썸네일 재생성은 하지 않고 manifest만 비교
+    Returns:
+        (manifest, diff): 최신 버전이 없거나 scan 폴더가 그대로면 diff는 None
+    """
+    manifest = build_manifest(date_path)
+    if not latest_xlsx_path:
+        return manifest, None
+    # 바뀐 것이 없어도 테이블에 표시할 것이므로 미리 읽어서 캐시에 넣어둠
+    old_sheet = load_sheet(latest_xlsx_path)
+    if is_manifest_current(latest_xlsx_path, manifest):
+        return manifest, None
+    diff = diff_directories(old_sheet.column("Directory"), load_manifest(latest_xlsx_path), manifest)
+    if not diff:
+        write_manifest(latest_xlsx_path, manifest)
+    return manifest, diff
 
-    wb.save(save_path)
-    print(f"[OK] Table saved to {save_path}")
+def save_rescan_version(date_path, old_sheet, diff, manifest, xlsx_path):
+    """
+    바뀐 폴더만 다시 추출(썸네일 포함)해서 이전 버전과 합친 뒤 새 버전으로 저장
+    Returns:
+        str: 저장한 xlsx 경로, 다시 읽어보니 바뀐 것이 없으면 None (저장하지 않음)
+    """
+    sheet, diff = rescan_changes(date_path, old_sheet, diff)
+    if not diff:
+        return None
+    return save_sheet_version(sheet, xlsx_path, manifest)
@@ -0,0 +1,203 @@
+import os
+import re
+import socket
+import sqlite3
+import time
+from .cache_dir import get_cache_dir
+from .version_store import get_stored_versions, get_version_path, get_version_prefix, parse_version_path
+
+INDEX_FILE_NAME = "version_index.db"
+RESERVATION_DIR_NAME = "reservations"
+# 다른 작업자가 index를 쓰고 있을 때 기다리는 시간 (초)
+LOCK_TIMEOUT = 30
+
+
+def _owner():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class VersionIndex(object):
+    """
+    date 폴더 하나의 list 버전 번호 index (.iomanager/version_index.db)
+    - 최신 버전 조회는 index에서 바로 (date 폴더가 바뀐 경우에만 listdir로 다시 맞춤)
+    - 새 버전 번호는 reservations/vNNN 파일을 O_EXCL로 만들어서 예약
+      (여러 작업자가 공유 스토리지에서 동시에 저장해도 같은 번호를 받지 않음)
+    versions: (version, state, owner, updated) state는 "reserved" 또는 "saved"
+    """
+
+    def __init__(self, date_path):
+        self.date_path = date_path
+        cache_dir = get_cache_dir(date_path)
+        self.reservation_dir = os.path.join(cache_dir, RESERVATION_DIR_NAME)
+        os.makedirs(self.reservation_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(cache_dir, INDEX_FILE_NAME), timeout=LOCK_TIMEOUT, isolation_level=None
+        )
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "version INTEGER PRIMARY KEY, state TEXT, owner TEXT, updated REAL);"
+            "CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value);"
+        )
+
+    def _stamp(self):
+        # xlsx 추가/삭제, 다른 작업자의 예약이 있으면 폴더 mtime이 바뀜
+        return f"{os.stat(self.date_path).st_mtime_ns}:{os.stat(self.reservation_dir).st_mtime_ns}"
+
+    def _is_synced(self, stamp):
+        row = self._conn.execute("SELECT value FROM info WHERE key = 'stamp'").fetchone()
+        return bool(row) and row[0] == stamp
+
+    def _sync(self):
+        """date 폴더가 index에 기록된 이후 바뀌었으면 xlsx / 히스토리 / 예약 파일로 다시 맞춤"""
+        stamp = self._stamp()
+        if self._is_synced(stamp):
+            return
+
+        pattern = re.compile(rf"{re.escape(get_version_prefix(self.date_path))}_list_v(\d{{3}})\.xlsx$")
+        saved = {int(match.group(1)) for match in map(pattern.match, os.listdir(self.date_path)) if match}
+        saved.update(get_stored_versions(self.date_path))
+        reserved = {int(name[1:]) for name in os.listdir(self.reservation_dir) if re.match(r"v\d+$", name)}
+
+        now = time.time()
+        # 직접 지운 xlsx (히스토리에도 없는 버전)는 최신 버전 후보에서 제외
+        stale = [version for (version,) in self._conn.execute("SELECT version FROM versions WHERE state = 'saved'")
+                 if version not in saved]
+        self._conn.executemany("DELETE FROM versions WHERE version = ?", [(version,) for version in stale])
+        self._conn.executemany(
+            "INSERT INTO versions (version, state, owner, updated) VALUES (?, 'saved', NULL, ?) "
+            "ON CONFLICT(version) DO UPDATE SET state = 'saved'",
+            [(version, now) for version in saved],
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO versions (version, state, owner, updated) VALUES (?, 'reserved', NULL, ?)",
+            [(version, now) for version in reserved - saved],
+        )
+        self._conn.execute("INSERT OR REPLACE INTO info (key, value) VALUES ('stamp', ?)", (stamp,))
+
+    def _transaction(self):
+        # BEGIN IMMEDIATE: 다른 작업자의 쓰기가 끝날 때까지 기다렸다가 시작
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def _read(self, query):
+        """
+        index가 date 폴더와 맞으면 잠금 없이 바로 읽음
+        다시 맞춰야 할 때만 BEGIN IMMEDIATE로 _sync 후 읽음
+        """
+        if self._is_synced(self._stamp()):
+            return self._conn.execute(query).fetchall()
+        self._transaction()
+        try:
+            self._sync()
+            rows = self._conn.execute(query).fetchall()
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return rows
+
+    def latest_version(self):
+        """
+        Returns:
+            int: 저장이 끝난 가장 높은 버전, 없으면 None
+        """
+        return self._read("SELECT MAX(version) FROM versions WHERE state = 'saved'")[0][0]
+
+    def saved_versions(self):
+        """저장이 끝난 버전 번호 리스트 (오름차순)"""
+        rows = self._read("SELECT version FROM versions WHERE state = 'saved' ORDER BY version")
+        return [version for (version,) in rows]
+
+    def reserve(self):
+        """
+        다음 버전 번호를 예약 (저장 후 mark_saved, 취소하면 release)
+        Returns:
+            int: 예약한 버전 번호
+        """
+        self._transaction()
+        try:
+            self._sync()
+            (latest,) = self._conn.execute("SELECT MAX(version) FROM versions").fetchone()
+            version = (latest or 0) + 1
+            while True:
+                # index 파일 잠금을 믿을 수 없는 스토리지에서도 번호 하나는 한 작업자만 가짐
+                try:
+                    fd = os.open(os.path.join(self.reservation_dir, f"v{version:03d}"),
+                                 os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    version += 1
+                    continue
+                os.write(fd, _owner().encode("utf-8"))
+                os.close(fd)
+                break
+            self._conn.execute(
+                "INSERT OR REPLACE INTO versions (version, state, owner, updated) VALUES (?, 'reserved', ?, ?)",
+                (version, _owner(), time.time()),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return version
+
+    def mark_saved(self, version):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO versions (version, state, owner, updated) VALUES (?, 'saved', ?, ?)",
+            (version, _owner(), time.time()),
+        )
+
+    def release(self, version):
+        """저장하지 않은 예약 취소 (번호를 다시 쓸 수 있음)"""
+        self._conn.execute("DELETE FROM versions WHERE version = ? AND state = 'reserved'", (version,))
+        marker = os.path.join(self.reservation_dir, f"v{version:03d}")
+        if os.path.exists(marker):
+            os.remove(marker)
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_latest_version(date_path):
+    with VersionIndex(date_path) as index:
+        return index.latest_version()
+
+
+def list_version_paths(date_path):
+    with VersionIndex(date_path) as index:
+        return [get_version_path(date_path, version) for version in index.saved_versions()]
+
+
+def get_latest_version_path(date_path):
+    version = get_latest_version(date_path)
+    if version is None:
+        return None
+    return get_version_path(date_path, version)
+
+
+def reserve_version_path(date_path):
+    """다음 버전 xlsx 경로를 예약해서 반환"""
+    with VersionIndex(date_path) as index:
+        return get_version_path(date_path, index.reserve())
+
+
+def mark_version_saved(xlsx_path):
+    parsed = parse_version_path(xlsx_path)
+    if parsed is None:
+        return
+    date_path, version = parsed
+    with VersionIndex(date_path) as index:
+        index.mark_saved(version)
+
+
+def release_version(xlsx_path):
+    parsed = parse_version_path(xlsx_path)
+    if parsed is None:
+        return
+    date_path, version = parsed
+    with VersionIndex(date_path) as index:
+        index.release(version)
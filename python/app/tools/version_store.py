@@ -0,0 +1,375 @@
+"""
+list 버전 히스토리 (date 폴더의 .iomanager/versions.db)
+
+버전마다 xlsx를 통째로 저장하지 않고 이전 버전과의 행 단위 차이(delta)만 저장
+SNAPSHOT_INTERVAL 버전마다 전체 행(snapshot)을 저장해서 복원 비용을 제한
+xlsx는 필요할 때 table_to_metalist.materialize_version 으로 만듦
+
+    # 히스토리 정리 (delta 재계산 + 복원 가능한 이전 버전 xlsx 삭제)
+    cd python/app && python -m tools.version_store compact /show/{project}/product/scan/{date} --prune-xlsx
+"""
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from .cache_dir import CACHE_DIR_NAME, get_cache_dir
+
+STORE_FILE_NAME = "versions.db"
+# delta가 이 개수만큼 이어지면 다음 버전은 snapshot으로 저장
+SNAPSHOT_INTERVAL = 10
+KEY_HEADER = "Directory"
+
+
+def get_version_prefix(date_path):
+    return os.path.basename(os.path.normpath(date_path))
+
+
+def get_version_path(date_path, version):
+    return os.path.join(date_path, f"{get_version_prefix(date_path)}_list_v{version:03d}.xlsx")
+
+
+def parse_version_path(xlsx_path):
+    """
+    .../{date}/{date}_list_v003.xlsx -> (date_path, 3)
+    Returns:
+        tuple: 버전 파일 이름 규칙이 아니면 None
+    """
+    date_path = os.path.dirname(os.path.abspath(xlsx_path))
+    prefix = re.escape(get_version_prefix(date_path))
+    match = re.match(rf"{prefix}_list_v(\d{{3}})\.xlsx$", os.path.basename(xlsx_path))
+    if not match:
+        return None
+    return date_path, int(match.group(1))
+
+
+def _pack(data):
+    return zlib.compress(json.dumps(data, default=str, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def _row_keys(headers, rows):
+    """행마다 (Directory, 같은 Directory 안에서의 순서) key, Directory 열이 없으면 None"""
+    if KEY_HEADER not in headers:
+        return None
+    position = headers.index(KEY_HEADER)
+    seen = {}
+    keys = []
+    for values in rows:
+        directory = values[position]
+        index = seen.get(directory, 0)
+        seen[directory] = index + 1
+        keys.append((directory, index))
+    return keys
+
+
+def encode_delta(parent_headers, parent_rows, headers, rows):
+    """
+    parent -> 새 버전 행 단위 delta
+    ops:
+        ["=", start, count]      parent의 start부터 count행을 그대로 사용
+        ["~", row, {h: value}]   parent row에 일부 열만 변경
+        ["+", {h: value}]        새 행 (빈 값 제외)
+    """
+    parent_keys = _row_keys(parent_headers, parent_rows)
+    keys = _row_keys(headers, rows)
+    if parent_keys is not None and keys is not None:
+        parent_index = {key: row for row, key in enumerate(parent_keys)}
+        matches = [parent_index.get(key) for key in keys]
+    else:
+        # key 열이 없으면 같은 위치의 행끼리 비교
+        matches = [row if row < len(parent_rows) else None for row in range(len(rows))]
+
+    ops = []
+    for values, parent_row in zip(rows, matches):
+        if parent_row is None:
+            ops.append(["+", {h: v for h, v in zip(headers, values) if v != ""}])
+            continue
+        parent = dict(zip(parent_headers, parent_rows[parent_row]))
+        patch = {h: v for h, v in zip(headers, values) if parent.get(h, "") != v}
+        if patch:
+            ops.append(["~", parent_row, patch])
+        elif ops and ops[-1][0] == "=" and ops[-1][1] + ops[-1][2] == parent_row:
+            ops[-1][2] += 1
+        else:
+            ops.append(["=", parent_row, 1])
+    return ops
+
+
+def apply_delta(parent_headers, parent_rows, headers, ops):
+    def project(values, patch=None):
+        row = dict(zip(parent_headers, values))
+        if patch:
+            row.update(patch)
+        return [row.get(h, "") for h in headers]
+
+    rows = []
+    for op in ops:
+        if op[0] == "=":
+            _, start, count = op
+            rows.extend(project(values) for values in parent_rows[start:start + count])
+        elif op[0] == "~":
+            _, parent_row, patch = op
+            rows.append(project(parent_rows[parent_row], patch))
+        else:
+            rows.append([op[1].get(h, "") for h in headers])
+    return rows
+
+
+class VersionStore(object):
+    """
+    date 폴더 하나의 list 버전 히스토리
+    versions: (version, parent, headers, row_count, manifest, created)
+              parent가 NULL이면 snapshot, 아니면 parent 버전에 대한 delta
+    payload:  version 별 압축된 rows(snapshot) 또는 ops(delta)
+    """
+
+    def __init__(self, date_path):
+        self.date_path = date_path
+        self.db_path = os.path.join(get_cache_dir(date_path), STORE_FILE_NAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS versions ("
+            "version INTEGER PRIMARY KEY, parent INTEGER, headers TEXT, "
+            "row_count INTEGER, manifest TEXT, created REAL);"
+            "CREATE TABLE IF NOT EXISTS payload (version INTEGER PRIMARY KEY, data BLOB);"
+        )
+        self._conn.commit()
+
+    def versions(self):
+        with self._lock:
+            return [version for (version,) in self._conn.execute("SELECT version FROM versions ORDER BY version")]
+
+    def has_version(self, version):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM versions WHERE version = ?", (version,)).fetchone() is not None
+
+    def _chain_length(self, version):
+        length = 0
+        while version is not None:
+            row = self._conn.execute("SELECT parent FROM versions WHERE version = ?", (version,)).fetchone()
+            if row is None or row[0] is None:
+                break
+            version = row[0]
+            length += 1
+        return length
+
+    def _load_rows(self, version):
+        """version의 (headers, rows) 복원 (가장 가까운 snapshot부터 delta 적용)"""
+        chain = []
+        current = version
+        while current is not None:
+            row = self._conn.execute(
+                "SELECT v.parent, v.headers, p.data FROM versions v JOIN payload p ON v.version = p.version "
+                "WHERE v.version = ?",
+                (current,),
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Version v{version:03d} not found in history")
+            parent, headers, data = row
+            chain.append((json.loads(headers), _unpack(data)))
+            current = parent
+
+        headers, rows = chain.pop()
+        while chain:
+            next_headers, ops = chain.pop()
+            rows = apply_delta(headers, rows, next_headers, ops)
+            headers = next_headers
+        return headers, rows
+
+    def load(self, version):
+        """
+        Returns:
+            (headers, rows): rows는 headers 순서의 값 리스트
+        """
+        with self._lock:
+            return self._load_rows(version)
+
+    def load_manifest(self, version):
+        with self._lock:
+            row = self._conn.execute("SELECT manifest FROM versions WHERE version = ?", (version,)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(row[0])
+
+    def _write(self, version, parent, headers, rows, manifest, created=None):
+        snapshot = _pack(rows)
+        data = snapshot
+        if parent is not None:
+            parent_headers, parent_rows = self._load_rows(parent)
+            delta = _pack(encode_delta(parent_headers, parent_rows, headers, rows))
+            # delta가 snapshot과 크기가 비슷하면 snapshot으로 저장
+            if len(delta) * 2 < len(snapshot):
+                data = delta
+            else:
+                parent = None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO versions (version, parent, headers, row_count, manifest, created) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (version, parent, json.dumps(headers), len(rows),
+             json.dumps(manifest) if manifest is not None else None, created or time.time()),
+        )
+        self._conn.execute("INSERT OR REPLACE INTO payload (version, data) VALUES (?, ?)", (version, data))
+        return len(data), parent is not None
+
+    def save(self, version, sheet, manifest=None):
+        """
+        sheet를 version으로 기록, 바로 앞 버전이 있으면 delta로 저장
+        Args:
+            sheet: headers / iter_rows() 를 가진 Sheet
+            manifest: 이 버전의 스캔 폴더 manifest
+        Returns:
+            int: 저장한 payload 크기 (byte)
+        """
+        headers = list(sheet.headers)
+        rows = [list(values) for values in sheet.iter_rows()]
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(version) FROM versions WHERE version < ?", (version,)
+            ).fetchone()
+            parent = row[0] if row else None
+            if parent is not None and self._chain_length(parent) + 1 >= SNAPSHOT_INTERVAL:
+                parent = None
+            size, is_delta = self._write(version, parent, headers, rows, manifest)
+            self._conn.commit()
+        kind = "delta" if is_delta else "snapshot"
+        print(f"[OK] Version v{version:03d} recorded in history ({kind}, {size} bytes)")
+        return size
+
+    def compact(self, snapshot_interval=SNAPSHOT_INTERVAL):
+        """
+        모든 버전을 순서대로 다시 인코딩 (snapshot_interval 마다 snapshot, 나머지는 이전 버전 delta)
+        Returns:
+            (before, after): payload 전체 크기 (byte)
+        """
+        with self._lock:
+            before = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM payload").fetchone()[0]
+            records = self._conn.execute(
+                "SELECT version, manifest, created FROM versions ORDER BY version"
+            ).fetchall()
+            restored = [(version, self._load_rows(version), manifest, created)
+                        for version, manifest, created in records]
+
+            self._conn.execute("DELETE FROM versions")
+            self._conn.execute("DELETE FROM payload")
+            previous = None
+            for index, (version, (headers, rows), manifest, created) in enumerate(restored):
+                parent = previous if index % snapshot_interval else None
+                self._write(version, parent, headers, rows,
+                            json.loads(manifest) if manifest else None, created)
+                previous = version
+            self._conn.commit()
+            after = self._conn.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM payload").fetchone()[0]
+            self._conn.execute("VACUUM")
+        return before, after
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_stored_versions(date_path):
+    """히스토리에 있는 버전 번호 리스트 (히스토리가 없으면 빈 리스트)"""
+    if not os.path.exists(os.path.join(date_path, CACHE_DIR_NAME, STORE_FILE_NAME)):
+        return []
+    with VersionStore(date_path) as store:
+        return store.versions()
+
+
+def is_version_available(xlsx_path):
+    """xlsx 파일이 있거나 히스토리에서 복원 가능한 버전인지"""
+    if os.path.exists(xlsx_path):
+        return True
+    parsed = parse_version_path(xlsx_path)
+    return parsed is not None and parsed[1] in get_stored_versions(parsed[0])
+
+
+def record_version(xlsx_path, sheet, manifest=None):
+    """버전 파일 이름 규칙의 xlsx 경로로 히스토리에 기록, 규칙이 아니면 무시"""
+    parsed = parse_version_path(xlsx_path)
+    if parsed is None:
+        return None
+    date_path, version = parsed
+    with VersionStore(date_path) as store:
+        return store.save(version, sheet, manifest)
+
+
+def load_stored_version(xlsx_path):
+    """
+    xlsx 경로에 해당하는 버전을 히스토리에서 복원
+    Returns:
+        (headers, rows): 히스토리에 없으면 None
+    """
+    parsed = parse_version_path(xlsx_path)
+    if parsed is None:
+        return None
+    date_path, version = parsed
+    if version not in get_stored_versions(date_path):
+        return None
+    with VersionStore(date_path) as store:
+        return store.load(version)
+
+
+def load_stored_manifest(xlsx_path):
+    parsed = parse_version_path(xlsx_path)
+    if parsed is None:
+        return None
+    date_path, version = parsed
+    if version not in get_stored_versions(date_path):
+        return None
+    with VersionStore(date_path) as store:
+        return store.load_manifest(version)
+
+
+def compact_history(date_path, snapshot_interval=SNAPSHOT_INTERVAL, prune_xlsx=False):
+    """
+    히스토리 재인코딩, prune_xlsx면 최신 버전을 제외하고 히스토리로 복원 가능한 xlsx/sidecar/manifest 삭제
+    Returns:
+        dict: {"before", "after", "removed"}
+    """
+    with VersionStore(date_path) as store:
+        before, after = store.compact(snapshot_interval)
+        versions = store.versions()
+
+    removed = []
+    if prune_xlsx and versions:
+        for version in versions[:-1]:
+            xlsx_path = get_version_path(date_path, version)
+            base = os.path.splitext(xlsx_path)[0]
+            for path in (xlsx_path, base + ".sheet.db", base + ".manifest.json"):
+                if os.path.exists(path):
+                    os.remove(path)
+                    removed.append(path)
+    print(f"[COMPLETE] History compacted: {before} -> {after} bytes, {len(removed)} files removed")
+    return {"before": before, "after": after, "removed": removed}
+
+
+def _main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="list 버전 히스토리 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+    compact = sub.add_parser("compact", help="히스토리 재인코딩")
+    compact.add_argument("date_path")
+    compact.add_argument("--snapshot-interval", type=int, default=SNAPSHOT_INTERVAL)
+    compact.add_argument("--prune-xlsx", action="store_true", help="복원 가능한 이전 버전 xlsx 삭제")
+    args = parser.parse_args(argv)
+
+    if args.command == "compact":
+        compact_history(args.date_path, args.snapshot_interval, args.prune_xlsx)
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,128 @@
+import io
+import os
+from openpyxl import Workbook
+from openpyxl.drawing.image import Image
+from openpyxl.utils import get_column_letter
+from PIL import Image as PILImage
+from .sheet import normalize_value
+from .sheet_store import SheetDbWriter, close_sheet_sidecar, get_sidecar_path
+
+# xlsx 안에서 썸네일이 표시되는 크기
+THUMBNAIL_SIZE = (192, 108)
+THUMBNAIL_QUALITY = 85
+
+
+def make_xlsx_thumbnail(thumb_path, size=THUMBNAIL_SIZE, quality=THUMBNAIL_QUALITY):
+    """
+    썸네일 JPG를 표시 크기로 줄이고 다시 압축한 openpyxl Image (원본 해상도를 넣지 않음)
+    Returns:
+        Image: 실패 시 None
+    """
+    if not thumb_path or not os.path.exists(thumb_path):
+        return None
+    try:
+        with PILImage.open(thumb_path) as src:
+            # JPEG는 decode 단계에서 바로 축소 (DCT scaling)
+            src.draft("RGB", size)
+            img = src.convert("RGB")
+        img.thumbnail(size, PILImage.LANCZOS)
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=quality, optimize=True)
+        buf.seek(0)
+        xl_img = Image(buf)
+    except Exception as e:
+        print(f"[WARN] Thumbnail resize failed: {thumb_path} ({e})")
+        return None
+    xl_img.width, xl_img.height = size
+    return xl_img
+
+
+class XlsxStreamWriter(object):
+    """
+    write-only workbook으로 행을 받는 대로 바로 기록 (셀 객체를 메모리에 쌓지 않음)
+    close() 때 임시 파일에 저장 후 교체하므로 중간 상태의 xlsx가 보이지 않음
+    sidecar가 True면 같은 행을 sidecar(.sheet.db)에도 chunk 단위로 기록 (내부 읽기용)
+
+    Usage:
+        with XlsxStreamWriter(xlsx_path, headers) as writer:
+            for meta in meta_list:
+                writer.append(meta)
+    """
+
+    def __init__(self, xlsx_path, headers, title="Metadata", sidecar=True):
+        self.xlsx_path = xlsx_path
+        self.headers = list(headers)
+        self.row_count = 0
+        self._sidecar = SheetDbWriter(get_sidecar_path(xlsx_path), self.headers) if sidecar else None
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet(title)
+        self._thumb_col = None
+        if "thumbnail" in self.headers:
+            self._thumb_col = get_column_letter(self.headers.index("thumbnail") + 1)
+            # 썸네일 열 너비를 이미지 크기에 맞춤 (첫 행을 쓰기 전에만 지정 가능)
+            self._ws.column_dimensions[self._thumb_col].width = THUMBNAIL_SIZE[0] / 7
+        self._ws.append(self.headers)
+
+    def append(self, row):
+        """
+        Args:
+            row: {header: value} dict 또는 headers 순서의 값 리스트
+        """
+        if isinstance(row, dict):
+            values = [normalize_value(row.get(header, "")) for header in self.headers]
+        else:
+            values = [normalize_value(value) for value in row]
+        self._ws.append(values)
+        if self._sidecar is not None:
+            self._sidecar.append(values)
+        self.row_count += 1
+
+        if self._thumb_col and "thumbnail_path" in self.headers:
+            thumb_path = values[self.headers.index("thumbnail_path")]
+            img = make_xlsx_thumbnail(thumb_path)
+            if img is not None:
+                # +1(헤더) +1(1부터 시작)
+                self._ws.add_image(img, f"{self._thumb_col}{self.row_count + 1}")
+
+    def close(self):
+        if self._wb is None:
+            return
+        tmp_path = self.xlsx_path + ".tmp"
+        try:
+            self._wb.save(tmp_path)
+            os.replace(tmp_path, self.xlsx_path)
+        except Exception:
+            self._abort_sidecar()
+            raise
+        finally:
+            self._wb = None
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        if self._sidecar is None:
+            return
+        try:
+            close_sheet_sidecar(self._sidecar, self.xlsx_path)
+        except Exception as e:
+            # sidecar가 없으면 다음 읽기 때 xlsx에서 읽고 다시 만듦
+            print(f"[WARN] Sheet sidecar write failed: {e}")
+            self._abort_sidecar()
+        self._sidecar = None
+
+    def _abort_sidecar(self):
+        if self._sidecar is not None:
+            self._sidecar.abort()
+            self._sidecar = None
+
+    def abort(self):
+        # 실패/취소한 export는 기존 파일을 건드리지 않음
+        self._wb = None
+        self._abort_sidecar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
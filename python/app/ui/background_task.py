@@ -0,0 +1,58 @@
+from tank.platform.qt import QtCore
+for name, cls in QtCore.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+
+class BackgroundTask(QObject):
+    """
+    QThread 안에서 함수 하나를 실행 (Qt 객체를 다루지 않는 저장 작업 등)
+    """
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            print(f"[EXCEPTION] Background task failed: {e}")
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(result)
+
+
+def start_worker(parent, worker, on_finished, on_failed=None):
+    """
+    finished / failed 시그널과 run()을 가진 worker를 새 QThread에서 시작
+    (진행 상황 등 다른 시그널은 호출 전에 연결해 둘 것)
+    on_finished / on_failed 는 UI 스레드에서 실행되도록 QObject의 메서드를 넘길 것
+    Returns:
+        (QThread, worker): 호출한 쪽에서 참조를 유지해야 함
+    """
+    thread = QThread(parent)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    worker.finished.connect(on_finished)
+    if on_failed:
+        worker.failed.connect(on_failed)
+    worker.finished.connect(thread.quit)
+    worker.failed.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread, worker
+
+
+def start_background_task(parent, func, args, on_finished, on_failed=None):
+    """
+    BackgroundTask를 새 QThread에서 시작
+    Returns:
+        (QThread, BackgroundTask): 호출한 쪽에서 참조를 유지해야 함
+    """
+    return start_worker(parent, BackgroundTask(func, *args), on_finished, on_failed)
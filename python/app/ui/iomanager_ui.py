@@ -7,19 +7,24 @@ for name, cls in QtGui.__dict__.items():
     if isinstance(cls, type): globals()[name] = cls
 
 
-from ..event.io_event_handler import select_directory, toggle_edit_mode, select_xlsx_file
-from ..tools.export_metadata import export_metadata
-from ..tools.save_as_xlsx import save_as_xlsx
+from ..event.io_event_handler import select_directory, toggle_edit_mode, select_xlsx_file, select_export_file
+from ..tools.save_as_xlsx import DEFAULT_FIELDS
 from ..tools.get_latest_xlsx_file import get_latest_version_file
 from ..tools.get_new_version_file import get_new_version_name
-from ..tools.table_to_metalist import save_table_to_xlsx
-from ..tools.extract_directory_column import extract_directory_column
-from ..tools.generate_directory_list import generate_directory_list
+from ..tools.version_index import mark_version_saved, release_version, list_version_paths
+from ..tools.table_to_metalist import check_scan_folder, save_sheet_version, save_rescan_version, materialize_version
+from ..tools.version_store import record_version, is_version_available
 from ..tools.get_publish_info import get_publish_info
+from ..tools.manifest import write_manifest, load_manifest
+from ..tools.sheet import Sheet, load_sheet
+from ..tools.sheet_diff import diff_sheets, format_diff
+from .metadata_worker import start_metadata_stream
+from .table_export_worker import start_table_export
+from .background_task import start_background_task
+from .metadata_table_model import MetadataTableModel, THUMBNAIL_WIDTH, THUMBNAIL_ROW_HEIGHT
 from ..tools.rename import rename_sequence
-from ..tools.convert import exrs_to_jpgs, mov_to_exrs, exrs_to_video, exrs_to_montage, exrs_to_thumbnail
+from ..tools.convert import mov_to_publish, exrs_to_derivatives
 import os
-import pandas as pd
 import shotgun_api3
 import sgtk
 import sys
@@ -57,16 +62,30 @@ class IOManagerWidget(QWidget):
         base_path = os.path.expanduser("~")
         scan_path = os.path.join(base_path, "show", project_name, "product", "scan")
         self.file_path_le.setText(scan_path)
-        shot_select_btn = QPushButton("Select")
+        self.shot_select_btn = QPushButton("Select")
         # shot_load_btn = QPushButton("Load")
 
-        self.table = QTableWidget()
+        # 셀마다 위젯을 만들지 않고 model(Sheet)에서 보이는 셀만 그림
+        self.table = QTableView()
+        self.model = MetadataTableModel(self)
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        # 스크롤로 화면에서 벗어난 행의 썸네일 로드는 취소
+        self.table.verticalScrollBar().valueChanged.connect(self.on_table_scrolled)
 
         current_excel_label = QLabel("Currently displayed Excel file:")
         self.excel_label = QLabel("Ready to load")
-        excel_save_btn = QPushButton("Version and Save")
+        # 현재 표시 중인 버전의 xlsx 경로 (히스토리에만 있으면 파일이 없을 수 있음)
+        self.current_xlsx_path = ""
+        self.excel_save_btn = QPushButton("Version and Save")
         self.excel_edit_btn = QPushButton("Enable Edit")
         select_excel_btn = QPushButton("Select Excel")
+        self.write_excel_btn = QPushButton("Write Excel")
+        self.export_table_btn = QPushButton("Export Table")
+        compare_btn = QPushButton("Compare Versions")
 
         publish_btn = QPushButton("Publish")
 
@@ -75,12 +94,16 @@ class IOManagerWidget(QWidget):
         #     lambda: select_directory(self.file_path_le)
         # )
         # shot_load_btn.clicked.connect(self.on_load_clicked)
-        shot_select_btn.clicked.connect(self.on_select_clicked)
+        self.shot_select_btn.clicked.connect(self.on_select_clicked)
         self.excel_edit_btn.clicked.connect(self.on_edit_clicked)
-        excel_save_btn.clicked.connect(self.on_save_clicked)
+        self.excel_save_btn.clicked.connect(self.on_save_clicked)
         # self.project_cb.currentTextChanged.connect(self.on_project_selected)
         select_excel_btn.clicked.connect(self.on_select_excel_clicked)
+        self.write_excel_btn.clicked.connect(self.on_write_excel_clicked)
+        self.export_table_btn.clicked.connect(self.on_export_table_clicked)
+        compare_btn.clicked.connect(self.on_compare_clicked)
         publish_btn.clicked.connect(self.on_publish_clicked)
+        self.model.check_toggled.connect(self.on_checkbox_toggled)
 
         # Layout
         main_layout = QVBoxLayout()
@@ -97,14 +120,17 @@ class IOManagerWidget(QWidget):
         shot_select_container.addStretch()
         shot_select_container.addWidget(file_path_label)
         shot_select_container.addWidget(self.file_path_le)
-        shot_select_container.addWidget(shot_select_btn)
+        shot_select_container.addWidget(self.shot_select_btn)
         #shot_select_container.addWidget(shot_load_btn)
         
         excel_label_conatainer.addWidget(current_excel_label, alignment=Qt.AlignTop)
         excel_label_conatainer.addWidget(self.excel_label, alignment=Qt.AlignTop)
-        excel_btn_layout.addWidget(excel_save_btn)
+        excel_btn_layout.addWidget(self.excel_save_btn)
         excel_btn_layout.addWidget(self.excel_edit_btn)
         excel_btn_layout2.addWidget(select_excel_btn)
+        excel_btn_layout2.addWidget(self.write_excel_btn)
+        excel_btn_layout2.addWidget(self.export_table_btn)
+        excel_btn_layout2.addWidget(compare_btn)
         excel_container.addLayout(excel_btn_layout)
         excel_container.addLayout(excel_btn_layout2)
         excel_group.setLayout(excel_container)
@@ -118,6 +144,30 @@ class IOManagerWidget(QWidget):
 
         self.setLayout(main_layout)
         self.edit_mode = False
+        # 현재 표시 중인 xlsx의 Sheet (테이블, 체크박스 검증, publish 에서 공유)
+        self.sheet = None
+
+        # streaming scan 상태
+        self._scan_thread = None
+        self._scan_worker = None
+        # 스캔 결과 xlsx 백그라운드 저장 상태
+        self._write_thread = None
+        self._write_task = None
+        # table export 상태
+        self._export_thread = None
+        self._export_worker = None
+        # 히스토리 버전 xlsx 쓰기 상태
+        self._materialize_thread = None
+        self._materialize_task = None
+        # Select 시 scan 폴더 확인 상태
+        self._check_thread = None
+        self._check_task = None
+        self._check_latest_path = None
+        self._scan_date_path = None
+        self._scan_manifest = None
+        # 백그라운드 저장 중인 (예약한) 버전 경로, 다시 스캔한 경우 이전 버전 경로
+        self._write_path = None
+        self._rescan_latest_path = None
 
     # def set_scan_path(self, project_name):
     #     base_path = os.path.expanduser("~")
@@ -132,50 +182,208 @@ class IOManagerWidget(QWidget):
         date_path = self.file_path_le.text()
         # First get latest version of xlsx file
         latest_xlsx_path = get_latest_version_file(date_path)
+
+        # scan 폴더 manifest 생성(프레임마다 stat)과 최신 버전 비교는 백그라운드에서
+        # (확인 전에는 manifest만 비교, 추출 / 썸네일 재생성은 사용자가 Yes를 누른 뒤)
+        self._scan_date_path = date_path
+        self._check_latest_path = latest_xlsx_path
+        self.set_excel_status("Checking scan folder...")
+        self.shot_select_btn.setEnabled(False)
+        self._check_thread, self._check_task = start_background_task(
+            self,
+            check_scan_folder,
+            (date_path, latest_xlsx_path),
+            self.on_scan_folder_checked,
+            self.on_scan_folder_check_failed,
+        )
+
+    def on_scan_folder_checked(self, result):
+        self._check_thread = None
+        self._check_task = None
+        self.shot_select_btn.setEnabled(True)
+        manifest, diff = result
+        date_path = self._scan_date_path
+        latest_xlsx_path = self._check_latest_path
         # If not xlsx file, export metadata and save as {prefix_date}_list_v001.xlsx
+        # 스캔이 끝나기 전에도 행이 준비되는 대로 테이블에 추가
         if not latest_xlsx_path:
-            meta_data = export_metadata(date_path)
-            latest_xlsx_path = save_as_xlsx(date_path, latest_xlsx_path, meta_data)
-            self.update_table(latest_xlsx_path)
-            self.excel_label.setText(latest_xlsx_path)
+            self.start_streaming_scan(date_path, manifest)
             return
-        
-        # If xlsx file exists
-        meta_data_list = export_metadata(date_path)
 
-        # Compare "Directory" column
-        dirs_from_xlsx = sorted(extract_directory_column(latest_xlsx_path))
-        current_dirs = sorted(generate_directory_list(meta_data_list))
-
-        if dirs_from_xlsx == current_dirs:
+        if diff is None:
+            print(f"[SKIP] Scan folder unchanged since {os.path.basename(latest_xlsx_path)}")
+        else:
+            print(f"[INFO] Scan folder changes: {diff}")
+        if not diff:
+            # Sheet는 백그라운드에서 읽어 캐시에 있음
             self.update_table(latest_xlsx_path)
-            self.excel_label.setText(latest_xlsx_path)
+            self.set_excel_label(latest_xlsx_path)
         else:
-            self.show_update_dialog(meta_data_list, date_path)
+            self.show_update_dialog(load_sheet(latest_xlsx_path), diff, date_path, manifest, latest_xlsx_path)
+
+    def on_scan_folder_check_failed(self, message):
+        self._check_thread = None
+        self._check_task = None
+        self.shot_select_btn.setEnabled(True)
+        self.set_excel_status("Ready to load")
+        QMessageBox.warning(self, "Scan Failed", f"Scan folder check failed:\n{message}")
+
+    def start_streaming_scan(self, date_path, manifest):
+        self._scan_date_path = date_path
+        self._scan_manifest = manifest
+        self.begin_stream_table()
+        self.set_excel_status("Scanning...")
+        self.shot_select_btn.setEnabled(False)
+        self._scan_thread, self._scan_worker = start_metadata_stream(
+            self,
+            date_path,
+            self.append_table_row,
+            self.on_stream_finished,
+            self.on_stream_failed,
+        )
 
-    def show_update_dialog(self, meta_data_list, date_path):
+    def on_stream_finished(self, meta_data):
+        self._scan_thread = None
+        self._scan_worker = None
+        date_path = self._scan_date_path
+        if not meta_data:
+            self.shot_select_btn.setEnabled(True)
+            QMessageBox.warning(None, "Load Stopped", "No shots for exporting excel file")
+            self.set_excel_status("Ready to load")
+            return
+        # 다른 작업자와 번호가 겹치지 않도록 첫 버전도 version index에서 예약
+        reserved_path = get_new_version_name(date_path)
+
+        # 테이블에는 이미 스캔한 행이 모두 있으므로 xlsx를 다시 읽지 않고 바로 사용
+        # (저장용 Sheet와 편집용 model Sheet는 따로 유지)
+        self.sheet = self.model.sheet.copy()
+        self.sheet.path = reserved_path
+        self._write_path = reserved_path
+        self.set_excel_label(reserved_path)
+        self.excel_label.setText(f"{reserved_path}\n(saving...)")
+        self.update_table_layout()
+
+        # xlsx / sidecar / manifest / 히스토리 저장은 백그라운드에서
+        # (저장이 끝나기 전에는 버전이 index에 없으므로 다시 스캔/저장하지 않도록 막음)
+        self.excel_save_btn.setEnabled(False)
+        self._write_thread, self._write_task = start_background_task(
+            self,
+            save_sheet_version,
+            (self.sheet, reserved_path, self._scan_manifest),
+            self.on_scan_version_saved,
+            self.on_scan_version_failed,
+        )
+
+    def on_scan_version_saved(self, xlsx_path):
+        self._write_thread = None
+        self._write_task = None
+        self._write_path = None
+        # 저장 중에는 xlsx가 없어서 히스토리 전용으로 표시됐던 label 갱신
+        if self.current_xlsx_path == xlsx_path:
+            self.set_excel_label(xlsx_path)
+        self.excel_save_btn.setEnabled(True)
+        self.shot_select_btn.setEnabled(True)
+        print(f"[COMPLETE] Scan saved in background: {xlsx_path}")
+
+    def on_scan_version_failed(self, message):
+        self._write_thread = None
+        self._write_task = None
+        self.excel_save_btn.setEnabled(True)
+        self.shot_select_btn.setEnabled(True)
+        # 저장 중에 Select Excel로 다른 버전을 열었을 수 있으므로 label이 아닌 예약한 경로를 반환
+        reserved_path, self._write_path = self._write_path, None
+        release_version(reserved_path)
+        if self.current_xlsx_path == reserved_path:
+            self.set_excel_status("Ready to load")
+        QMessageBox.warning(self, "Save Failed", f"Excel file save failed:\n{message}")
+
+    def on_stream_failed(self, message):
+        self.shot_select_btn.setEnabled(True)
+        self._scan_thread = None
+        self._scan_worker = None
+        self.set_excel_status("Ready to load")
+        if message != "canceled":
+            QMessageBox.warning(self, "Scan Failed", f"Metadata scan failed:\n{message}")
+
+    def begin_stream_table(self):
+        self.edit_mode = False
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # 이전 폴더의 Sheet는 스캔이 끝나면 새 Sheet로 바뀜
+        self.sheet = None
+        self.model.set_sheet(Sheet(DEFAULT_FIELDS))
+        self.update_table_layout()
+
+    def append_table_row(self, meta):
+        # 처음 나온 메타데이터 키는 model에서 열로 추가
+        self.model.append_row(meta)
+
+    def show_update_dialog(self, old_sheet, diff, date_path, manifest, latest_xlsx_path):
         reply = QMessageBox.question(
             self,
             f"Update Detected in {os.path.basename(date_path)}",
-            "Something changed!\nDo you want to update & open the xlsx file",
+            "Something changed!\n"
+            f"Added: {len(diff.added)}, Removed: {len(diff.removed)}, Changed: {len(diff.changed)}\n"
+            "Do you want to update & open the xlsx file",
             QMessageBox.Yes | QMessageBox.No
         )
 
-        if reply == QMessageBox.Yes:
-            new_name = get_new_version_name(date_path)
-            new_path = os.path.join(date_path, new_name)
-            save_as_xlsx(date_path, new_name, meta_data_list)
-            self.update_table(new_path)
-            self.excel_label.setText(new_path)
-        else:
+        # 갱신이 끝날 때까지는 이전 버전을 보여줌
+        self.update_table(latest_xlsx_path)
+        self.set_excel_label(latest_xlsx_path)
+        if reply != QMessageBox.Yes:
             print("[CANCEL] Update canceled")
+            return
+
+        # 바뀐 폴더만 다시 추출해서 이전 버전에 합치고 새 버전으로 저장 (백그라운드)
+        # seq_name / shot_name 등 이전 버전에서 입력한 값은 그대로 유지
+        self._write_path = get_new_version_name(date_path)
+        self._rescan_latest_path = latest_xlsx_path
+        self._scan_manifest = manifest
+        self.set_excel_status("Updating...")
+        self.shot_select_btn.setEnabled(False)
+        self.excel_save_btn.setEnabled(False)
+        self._write_thread, self._write_task = start_background_task(
+            self,
+            save_rescan_version,
+            (date_path, old_sheet, diff, manifest, self._write_path),
+            self.on_rescan_saved,
+            self.on_rescan_failed,
+        )
 
-            latest_xlsx_path = get_latest_version_file(date_path)
-            if latest_xlsx_path:
-                self.update_table(latest_xlsx_path)
-                self.excel_label.setText(latest_xlsx_path)
+    def _finish_rescan(self):
+        self._write_thread = None
+        self._write_task = None
+        self.shot_select_btn.setEnabled(True)
+        self.excel_save_btn.setEnabled(True)
+        reserved_path, self._write_path = self._write_path, None
+        return reserved_path, self._rescan_latest_path
+
+    def on_rescan_saved(self, xlsx_path):
+        reserved_path, latest_xlsx_path = self._finish_rescan()
+        if xlsx_path is None:
+            # 다시 읽어보니 값이 그대로인 경우 새 버전을 만들지 않음
+            print(f"[SKIP] No changes after extraction, keep {os.path.basename(latest_xlsx_path)}")
+            release_version(reserved_path)
+            write_manifest(latest_xlsx_path, self._scan_manifest)
+            self.set_excel_label(latest_xlsx_path)
+            return
+        # 다시 만든 썸네일이 이전 pixmap으로 보이지 않도록
+        self.model.thumbnail_loader.clear()
+        # 저장한 Sheet가 캐시에 들어가므로 update_table에서 다시 읽지 않음
+        self.update_table(xlsx_path)
+        self.set_excel_label(xlsx_path)
+        print(f"[COMPLETE] Updated version saved : {xlsx_path}")
+
+    def on_rescan_failed(self, message):
+        reserved_path, latest_xlsx_path = self._finish_rescan()
+        release_version(reserved_path)
+        self.set_excel_label(latest_xlsx_path)
+        QMessageBox.warning(self, "Update Failed", f"Scan folder update failed:\n{message}")
 
     def on_edit_clicked(self):
+        # export 중인 Sheet는 편집하지 않음
+        if self._export_thread is not None:
+            return
         self.edit_mode = toggle_edit_mode(self.table, self.edit_mode)
         if self.edit_mode:
             self.excel_edit_btn.setText("Disable Edit")
@@ -192,58 +400,71 @@ class IOManagerWidget(QWidget):
         reply = QMessageBox.question(
             self,
             "Confirm Save",
-            f"The file will be saved as\n{os.path.basename(xlsx_path)}\nDo you want to continue?",
+            f"Table edits will be recorded in the version history as\n{os.path.basename(xlsx_path)}\n"
+            "(use Write Excel to write the xlsx file)\nDo you want to continue?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            save_table_to_xlsx(self.table, xlsx_path)
-            self.excel_label.setText(xlsx_path)
+            # xlsx 전체를 다시 쓰지 않고 이전 버전과의 차이만 히스토리에 기록
+            # (xlsx가 필요하면 Write Excel)
+            # 테이블 편집만 저장하므로 스캔 폴더 manifest는 이전 버전 것을 그대로 사용
+            try:
+                record_version(xlsx_path, self.model.sheet.copy(), load_manifest(self.current_xlsx_path))
+                mark_version_saved(xlsx_path)
+            except Exception as e:
+                print(f"[EXCEPTION] Version save failed: {e}")
+                release_version(xlsx_path)
+                QMessageBox.warning(self, "Save Failed", f"Version save failed:\n{e}")
+                return
             self.update_table(xlsx_path)
-            print(f"[COMPLETE] Version up file saved : {xlsx_path}")
+            self.set_excel_label(xlsx_path)
+            print(f"[COMPLETE] Version recorded in history : {os.path.basename(xlsx_path)}")
         else:
-            pass
+            # 예약한 버전 번호 반환
+            release_version(xlsx_path)
+
+    def set_excel_label(self, xlsx_path):
+        self.current_xlsx_path = xlsx_path
+        if os.path.exists(xlsx_path):
+            self.excel_label.setText(xlsx_path)
+        else:
+            # 히스토리에만 저장된 버전 (Write Excel로 xlsx 생성)
+            self.excel_label.setText(f"{xlsx_path}\n(version history only, use Write Excel to write the xlsx)")
+
+    def set_excel_status(self, text):
+        self.current_xlsx_path = ""
+        self.excel_label.setText(text)
 
     def update_table(self, xlsx_path):
         self.edit_mode = False
-        df = pd.read_excel(xlsx_path)
-        self.table.setRowCount(len(df))
-        self.table.setColumnCount(len(df.columns) + 1)
-        header_list = ["check"] + df.columns.tolist()
-        self.table.setHorizontalHeaderLabels(header_list)
-        for row_idx, row_data in df.iterrows():
-            checkbox = QCheckBox()
-            checkbox.clicked.connect(lambda _, row = row_idx: self.on_checkbox_clicked(row, xlsx_path))
-            self.table.setCellWidget(row_idx, 0, checkbox)
-
-            for col_idx, header in enumerate(df.columns):
-                value = row_data[header]
-
-                # NaN 처리
-                if pd.isna(value):
-                    value = ""
-
-                # 썸네일 처리
-                if header == "thumbnail":
-                    value = row_data["thumbnail_path"]
-                    self.set_thumbnail_cell(row_idx, col_idx + 1, value)
-                    #item = QTableWidgetItem(value)
-                    #self.table.setItem(row_idx, col_idx + 1, item)
-                else:
-                    item = QTableWidgetItem(str(value))
-                    self.table.setItem(row_idx, col_idx + 1, item)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.sheet = load_sheet(xlsx_path)
+        # 테이블 편집은 복사본에 반영 (저장 전까지 load_sheet 캐시의 Sheet는 xlsx 내용 그대로)
+        self.model.set_sheet(self.sheet.copy())
+        self.update_table_layout()
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+
+    def update_table_layout(self):
+        thumb_col = self.model.thumbnail_column()
+        if thumb_col is None:
+            self.table.verticalHeader().setDefaultSectionSize(30)
+            return
+        self.table.verticalHeader().setDefaultSectionSize(THUMBNAIL_ROW_HEIGHT)
+        self.table.setColumnWidth(thumb_col, THUMBNAIL_WIDTH)
 
-    def on_checkbox_clicked(self, row, xlsx_path):
-        # print(f"[TEST] Checkbox clicked on row {row}")
-        app_root = os.path.dirname(__file__)
-        print(app_root)
-        df = pd.read_excel(xlsx_path)
+    def on_table_scrolled(self, value):
+        # 아직 시작하지 않은 로드를 취소하면 다시 그려지는 행만 get으로 다시 요청됨
+        self.model.thumbnail_loader.cancel_pending()
 
-        seq = df.at[row, "seq_name"]
-        shot = df.at[row, "shot_name"]
+    def on_checkbox_toggled(self, row, checked):
+        # print(f"[TEST] Checkbox clicked on row {row}")
+        if not checked:
+            return
+        # xlsx를 다시 읽지 않고 테이블에 보이는 model의 Sheet 사용 (스트리밍 스캔 중에도 같은 행)
+        seq = self.model.sheet.value(row, "seq_name")
+        shot = self.model.sheet.value(row, "shot_name")
 
-        if pd.isna(seq) or pd.isna(shot) or str(seq).strip() == "" or str(shot).strip() == "":
+        if str(seq).strip() == "" or str(shot).strip() == "":
             QMessageBox.warning(
             self,
             "Missing Data",
@@ -251,45 +472,162 @@ class IOManagerWidget(QWidget):
             QMessageBox.Ok
             )
 
-            checkbox = self.table.cellWidget(row, 0)
-            if isinstance(checkbox, QCheckBox):
-                checkbox.setChecked(False)
+            self.model.set_checked(row, False)
             return
 
         else:
             print(f"[OK] seq: {seq}, shot: {shot} at row {row + 1}")
 
-    def set_thumbnail_cell(self, row, col, img_path):
-        label = QLabel()
-        pixmap = QPixmap(img_path)
-        if not pixmap.isNull():
-            label.setPixmap(pixmap.scaledToWidth(400, Qt.SmoothTransformation))
-            label.setAlignment(Qt.AlignLeft)
-            self.table.setCellWidget(row, col, label)
-            self.table.setRowHeight(row, 230)
-            self.table.setColumnWidth(col, 400)
-
     def on_select_excel_clicked(self):
-        xlsx_file_path = select_xlsx_file(self.file_path_le)
+        date_path = self.file_path_le.text()
+        if not os.path.isdir(date_path):
+            return
+        # xlsx 파일이 없는 히스토리 버전도 선택할 수 있도록 version index의 목록을 보여줌
+        version_paths = list_version_paths(date_path)
+        browse_item = "Browse for xlsx file..."
+        names = [
+            os.path.basename(path) + ("" if os.path.exists(path) else "  (history only)")
+            for path in version_paths
+        ]
+        name, ok = QInputDialog.getItem(
+            self, "Select Version", "Open list version:", names + [browse_item], max(len(names) - 1, 0), False
+        )
+        if not ok:
+            return
+        if name == browse_item:
+            xlsx_file_path = select_xlsx_file(self.file_path_le)
+        else:
+            xlsx_file_path = version_paths[names.index(name)]
         if xlsx_file_path:
             self.update_table(xlsx_file_path)
-            self.excel_label.setText(xlsx_file_path)
+            self.set_excel_label(xlsx_file_path)
+
+    def on_write_excel_clicked(self):
+        # 히스토리에만 저장된 버전을 xlsx로 만듦 (테이블의 저장 전 편집 내용은 Version and Save로)
+        xlsx_path = self.current_xlsx_path
+        if self._materialize_thread is not None or not is_version_available(xlsx_path):
+            return
+        if os.path.exists(xlsx_path):
+            QMessageBox.information(self, "Write Excel", f"Excel file already exists:\n{xlsx_path}")
+            return
+        self.write_excel_btn.setEnabled(False)
+        self._materialize_thread, self._materialize_task = start_background_task(
+            self,
+            materialize_version,
+            (xlsx_path,),
+            self.on_materialize_finished,
+            self.on_materialize_failed,
+        )
+
+    def on_materialize_finished(self, xlsx_path):
+        self._materialize_thread = None
+        self._materialize_task = None
+        self.write_excel_btn.setEnabled(True)
+        # 쓰는 동안 다른 버전을 열었을 수 있음
+        if self.current_xlsx_path == xlsx_path:
+            self.set_excel_label(xlsx_path)
+        QMessageBox.information(self, "Write Complete", f"Excel file written to:\n{xlsx_path}")
+
+    def on_materialize_failed(self, message):
+        self._materialize_thread = None
+        self._materialize_task = None
+        self.write_excel_btn.setEnabled(True)
+        QMessageBox.warning(self, "Write Failed", f"Excel file write failed:\n{message}")
+
+    def on_compare_clicked(self):
+        current_path = self.current_xlsx_path
+        if not is_version_available(current_path):
+            return
+        version_paths = [path for path in list_version_paths(os.path.dirname(current_path)) if path != current_path]
+        if not version_paths:
+            QMessageBox.information(self, "Compare Versions", "No other version to compare.")
+            return
+        names = [os.path.basename(path) for path in version_paths]
+        name, ok = QInputDialog.getItem(
+            self, "Compare Versions", f"Compare {os.path.basename(current_path)} with:", names, len(names) - 1, False
+        )
+        if not ok:
+            return
+        other_path = version_paths[names.index(name)]
+        # 이름 순서(버전 번호)로 이전 / 이후 결정
+        old_path, new_path = sorted([other_path, current_path])
+        old_sheet = load_sheet(old_path)
+        # 현재 버전은 저장 전 편집 내용까지 포함한 테이블의 Sheet로 비교
+        new_sheet = self.model.sheet if new_path == current_path else load_sheet(new_path)
+        if old_path == current_path:
+            old_sheet = self.model.sheet
+        diff = diff_sheets(old_sheet, new_sheet)
+        print(f"[INFO] {os.path.basename(old_path)} -> {os.path.basename(new_path)}: {diff}")
+
+        msg = QMessageBox(self)
+        msg.setWindowTitle("Compare Versions")
+        msg.setText(f"{os.path.basename(old_path)} -> {os.path.basename(new_path)}")
+        msg.setInformativeText(diff.summary() if diff else "No changes.")
+        if diff:
+            msg.setDetailedText(format_diff(diff, old_sheet, new_sheet))
+        msg.exec_()
+
+    def on_export_table_clicked(self):
+        if self._export_thread is not None or not len(self.model.sheet):
+            return
+        default_path = os.path.splitext(self.current_xlsx_path)[0] + ".csv"
+        if not os.path.isdir(os.path.dirname(default_path)):
+            default_path = self.file_path_le.text()
+        export_path = select_export_file(self, default_path)
+        if not export_path:
+            return
+        # export 중에는 편집을 막고 model의 Sheet를 복사 없이 그대로 기록
+        self.edit_mode = False
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.excel_edit_btn.setText("Enable Edit")
+        self.export_table_btn.setEnabled(False)
+        self._export_thread, self._export_worker = start_table_export(
+            self,
+            self.model.sheet,
+            export_path,
+            self.on_export_finished,
+            self.on_export_failed,
+        )
+
+    def on_export_finished(self, path, row_count):
+        self._export_thread = None
+        self._export_worker = None
+        self.export_table_btn.setEnabled(True)
+        QMessageBox.information(self, "Export Complete", f"{row_count} rows exported to:\n{path}")
+
+    def on_export_failed(self, message):
+        self._export_thread = None
+        self._export_worker = None
+        self.export_table_btn.setEnabled(True)
+        if message != "canceled":
+            QMessageBox.warning(self, "Export Failed", f"Table export failed:\n{message}")
+
+    def closeEvent(self, event):
+        # 실행 중인 QThread가 widget과 함께 삭제되지 않도록 멈추고 끝날 때까지 기다림
+        # (xlsx 저장은 중간에 멈추지 않고 끝까지 기록)
+        for worker in (self._scan_worker, self._export_worker):
+            if worker is not None:
+                worker.stop()
+        threads = (
+            self._check_thread, self._scan_thread, self._write_thread, self._export_thread, self._materialize_thread,
+        )
+        for thread in threads:
+            if thread is not None:
+                thread.quit()
+                thread.wait()
+        super().closeEvent(event)
 
     def get_checked_rows(self):
-        checked_rows = []
-        for row in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(row, 0)
-            if isinstance(checkbox, QCheckBox) and checkbox.isChecked():
-                checked_rows.append(row + 2)
-        return checked_rows
+        # xlsx 행 번호 (헤더가 1행)
+        return [row + 2 for row in self.model.checked_rows()]
 
     def on_publish_clicked(self):
-        xlsx_file_path = self.excel_label.text()
+        xlsx_file_path = self.current_xlsx_path
         checked_rows = self.get_checked_rows()
         if not checked_rows:
             QMessageBox.information(self, "No Selection", "Please check at least one item to publish.", QMessageBox.Ok)
             return
-        shot_info_list = get_publish_info(xlsx_file_path, checked_rows)
+        shot_info_list = get_publish_info(xlsx_file_path, checked_rows, sheet=self.model.sheet)
         home_dir = os.path.expanduser("~")
         base_path = os.path.join(home_dir, "show")
         project_name = self.project_label.text()
@@ -335,24 +673,25 @@ class IOManagerWidget(QWidget):
             # exr -> rename + exr sequence to jpg sequence
             if ".exr" in exts:
                 rename_sequence(directory, org_path)
-                exrs_to_jpgs(org_path, jpg_path)
-                mp4_path = exrs_to_video(org_path, sg_path, vformat='mp4')
-                webm_path = exrs_to_video(org_path, sg_path, vformat='webm')
-                filmstrip_path = exrs_to_montage(org_path, sg_path)
-                thumbnail_path = exrs_to_thumbnail(org_path, sg_path)
+                # EXR decode 한 번으로 jpg / mp4 / webm / filmstrip / thumbnail 생성
+                derivatives = exrs_to_derivatives(org_path, jpg_path, sg_path)
+                mp4_path = derivatives["mp4"]
+                webm_path = derivatives["webm"]
+                filmstrip_path = derivatives["filmstrip"]
+                thumbnail_path = derivatives["thumbnail"]
             
             # mov -> mov to exr sequence + exr sequence to jpg sequence
             elif ".mov" in exts:
                 mov_path = os.path.join(directory,files[0])
-                success = mov_to_exrs(mov_path, org_path)
+                # org EXR 변환과 MOV에서 바로 만드는 derivative를 동시에 실행
+                success, derivatives = mov_to_publish(mov_path, org_path, jpg_path, sg_path)
                 if success:
-                    exrs_to_jpgs(org_path, jpg_path)
-                    mp4_path = exrs_to_video(org_path, sg_path, vformat='mp4')
-                    webm_path = exrs_to_video(org_path, sg_path, vformat='webm')
-                    filmstrip_path = exrs_to_montage(org_path, sg_path)
-                    thumbnail_path = exrs_to_thumbnail(org_path, sg_path)
+                    mp4_path = derivatives["mp4"]
+                    webm_path = derivatives["webm"]
+                    filmstrip_path = derivatives["filmstrip"]
+                    thumbnail_path = derivatives["thumbnail"]
 
-            if all(os.path.isfile(path) for path in [mp4_path, webm_path, filmstrip_path, thumbnail_path]):
+            if all(path and os.path.isfile(path) for path in [mp4_path, webm_path, filmstrip_path, thumbnail_path]):
                 project_id = self.sg.find_one("Project", [["name", "is", project_name]], ["id"])
                 # Create sequence
                 # 시퀀스 존재 여부 확인
@@ -415,5 +754,5 @@ class IOManagerWidget(QWidget):
             else:
                 print("[ERROR] One or more expected output files are missing:")
                 for path in [mp4_path, webm_path, filmstrip_path, thumbnail_path]:
-                    if not os.path.isfile(path):
+                    if not path or not os.path.isfile(path):
                         print(f" - Missing: {path}")
\ No newline at end of file
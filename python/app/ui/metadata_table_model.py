@@ -0,0 +1,184 @@
+from tank.platform.qt import QtCore
+for name, cls in QtCore.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+from tank.platform.qt import QtGui
+for name, cls in QtGui.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+
+from ..tools.sheet import Sheet
+from .thumbnail_loader import ThumbnailLoader
+
+CHECK_COLUMN = 0
+THUMBNAIL_WIDTH = 400
+THUMBNAIL_ROW_HEIGHT = 230
+
+
+def _enum_value(value):
+    # PySide6 enum / PySide2 enum / int 를 같은 값으로 비교하기 위함
+    return getattr(value, "value", value)
+
+
+class MetadataTableModel(QAbstractTableModel):
+    """
+    Sheet(열 단위 데이터)를 그대로 보여주는 table model
+    0번 열은 체크 상태 (model 안의 set으로 관리), 나머지는 sheet.headers 순서
+    view가 화면에 보이는 셀만 data()를 요청하므로 행/열이 많아도 셀 위젯을 만들지 않음
+    """
+    check_toggled = Signal(int, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sheet = Sheet()
+        self._checked = set()
+        # 썸네일 경로 -> 행 번호들 (로드 완료 시 해당 셀만 갱신)
+        self._thumb_rows = {}
+        self.thumbnail_loader = ThumbnailLoader(THUMBNAIL_WIDTH, parent=self)
+        self.thumbnail_loader.thumbnail_ready.connect(self._on_thumbnail_ready)
+
+    # ---- 데이터 교체 / 추가 ----
+    def set_sheet(self, sheet):
+        self.beginResetModel()
+        self.sheet = sheet
+        self._checked = set()
+        self.thumbnail_loader.forget_failures()
+        self._index_thumbnails()
+        self.endResetModel()
+
+    def _index_thumbnails(self):
+        self._thumb_rows = {}
+        for row, path in enumerate(self.sheet.column("thumbnail_path")):
+            if path:
+                self._thumb_rows.setdefault(path, []).append(row)
+
+    def append_row(self, meta):
+        new_keys = [key for key in meta if key not in self.sheet.columns]
+        if new_keys:
+            first = len(self.sheet.headers) + 1
+            self.beginInsertColumns(QModelIndex(), first, first + len(new_keys) - 1)
+            for key in new_keys:
+                self.sheet.add_column(key)
+            self.endInsertColumns()
+
+        row = len(self.sheet)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.sheet.append_row(meta)
+        path = self.sheet.value(row, "thumbnail_path")
+        if path:
+            self._thumb_rows.setdefault(path, []).append(row)
+        self.endInsertRows()
+
+    # ---- 체크 상태 ----
+    def is_checked(self, row):
+        return row in self._checked
+
+    def set_checked(self, row, checked):
+        if checked:
+            self._checked.add(row)
+        else:
+            self._checked.discard(row)
+        index = self.index(row, CHECK_COLUMN)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+
+    def checked_rows(self):
+        return sorted(self._checked)
+
+    # ---- QAbstractTableModel ----
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.sheet)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.sheet.headers) + 1
+
+    def header_name(self, column):
+        if column == CHECK_COLUMN:
+            return "check"
+        return self.sheet.headers[column - 1]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.header_name(section)
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.column() == CHECK_COLUMN:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        if self.header_name(index.column()) == "thumbnail":
+            return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+
+        if column == CHECK_COLUMN:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked else Qt.Unchecked
+            return None
+
+        header = self.header_name(column)
+        if header == "thumbnail":
+            if role == Qt.DecorationRole:
+                return self.thumbnail(row)
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            return str(self.sheet.value(row, header))
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row = index.row()
+        column = index.column()
+
+        if column == CHECK_COLUMN and role == Qt.CheckStateRole:
+            checked = _enum_value(value) == _enum_value(Qt.Checked)
+            self.set_checked(row, checked)
+            self.check_toggled.emit(row, checked)
+            return True
+
+        if role == Qt.EditRole and column != CHECK_COLUMN:
+            header = self.header_name(column)
+            self.sheet.set_value(row, header, value)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            if header == "thumbnail_path":
+                self._index_thumbnails()
+                thumb_col = self.thumbnail_column()
+                if thumb_col is not None:
+                    thumb_index = self.index(row, thumb_col)
+                    self.dataChanged.emit(thumb_index, thumb_index, [Qt.DecorationRole])
+            return True
+        return False
+
+    # ---- 썸네일 ----
+    def thumbnail_column(self):
+        if "thumbnail" not in self.sheet.columns:
+            return None
+        return self.sheet.headers.index("thumbnail") + 1
+
+    def thumbnail(self, row):
+        # view가 보이는 셀에 대해서만 요청하므로 화면에 보이는 썸네일만 로드됨
+        path = self.sheet.value(row, "thumbnail_path")
+        if not path:
+            return None
+        return self.thumbnail_loader.get(path)
+
+    def _on_thumbnail_ready(self, path):
+        column = self.thumbnail_column()
+        if column is None:
+            return
+        for row in self._thumb_rows.get(path, []):
+            index = self.index(row, column)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
@@ -0,0 +1,54 @@
+from tank.platform.qt import QtCore
+for name, cls in QtCore.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+
+from ..tools.export_metadata import iter_metadata
+from .background_task import start_worker
+
+
+class MetadataStreamWorker(QObject):
+    """
+    QThread 안에서 iter_metadata를 돌리면서 행이 준비될 때마다 row_ready 시그널 발생
+    """
+    row_ready = Signal(object)
+    finished = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, date_path):
+        super().__init__()
+        self.date_path = date_path
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    def run(self):
+        meta_list = []
+        try:
+            rows = iter_metadata(self.date_path)
+            for meta in rows:
+                if self._stop:
+                    rows.close()
+                    print("[CANCEL] Metadata scan stopped")
+                    self.failed.emit("canceled")
+                    return
+                meta_list.append(meta)
+                self.row_ready.emit(meta)
+        except Exception as e:
+            print(f"[EXCEPTION] Metadata scan failed: {e}")
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(meta_list)
+
+
+def start_metadata_stream(parent, date_path, on_row, on_finished, on_failed=None):
+    """
+    MetadataStreamWorker를 새 QThread에서 시작
+    on_row / on_finished / on_failed 는 UI 스레드에서 실행되도록 QObject의 메서드를 넘길 것
+    Returns:
+        (QThread, MetadataStreamWorker): 호출한 쪽에서 참조를 유지해야 함
+    """
+    worker = MetadataStreamWorker(date_path)
+    worker.row_ready.connect(on_row)
+    return start_worker(parent, worker, on_finished, on_failed)
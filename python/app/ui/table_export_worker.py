@@ -0,0 +1,55 @@
+from tank.platform.qt import QtCore
+for name, cls in QtCore.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+
+from ..tools.table_export import export_table
+from .background_task import start_worker
+
+
+class TableExportWorker(QObject):
+    """
+    QThread 안에서 export_table을 실행 (Sheet를 복사하지 않고 행 단위로 기록)
+    """
+    progress = Signal(int, int)
+    finished = Signal(str, int)
+    failed = Signal(str)
+
+    def __init__(self, sheet, path):
+        super().__init__()
+        self.sheet = sheet
+        self.path = path
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    def run(self):
+        try:
+            row_count = export_table(
+                self.sheet,
+                self.path,
+                should_stop=lambda: self._stop,
+                progress=self.progress.emit,
+            )
+        except Exception as e:
+            print(f"[EXCEPTION] Table export failed: {e}")
+            self.failed.emit(str(e))
+            return
+        if row_count is None:
+            self.failed.emit("canceled")
+            return
+        self.finished.emit(self.path, row_count)
+
+
+def start_table_export(parent, sheet, path, on_finished, on_failed=None, on_progress=None):
+    """
+    TableExportWorker를 새 QThread에서 시작
+    on_finished / on_failed / on_progress 는 UI 스레드에서 실행되도록 QObject의 메서드를 넘길 것
+    Returns:
+        (QThread, TableExportWorker): 호출한 쪽에서 참조를 유지해야 함
+    """
+    worker = TableExportWorker(sheet, path)
+    if on_progress:
+        worker.progress.connect(on_progress)
+    return start_worker(parent, worker, on_finished, on_failed)
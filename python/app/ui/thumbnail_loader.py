@@ -0,0 +1,153 @@
+from tank.platform.qt import QtCore
+for name, cls in QtCore.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+from tank.platform.qt import QtGui
+for name, cls in QtGui.__dict__.items():
+    if isinstance(cls, type): globals()[name] = cls
+
+
+import itertools
+from collections import OrderedDict
+
+# 썸네일 pixmap 캐시 최대 메모리 (byte)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_LOADER_THREADS = 4
+
+
+class PixmapCache(object):
+    """
+    메모리 사용량(byte) 기준 LRU pixmap 캐시
+    한도를 넘으면 가장 오래 사용하지 않은 pixmap부터 제거
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._items = OrderedDict()
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+        self._items.move_to_end(key)
+        return item[0]
+
+    def put(self, key, pixmap):
+        if key in self._items:
+            self.total_bytes -= self._items.pop(key)[1]
+        cost = self._cost(pixmap)
+        self._items[key] = (pixmap, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.max_bytes and len(self._items) > 1:
+            _, (_, evicted_cost) = self._items.popitem(last=False)
+            self.total_bytes -= evicted_cost
+
+    def clear(self):
+        self._items.clear()
+        self.total_bytes = 0
+
+
+class _LoadSignals(QObject):
+    loaded = Signal(object, object)
+
+
+class ThumbnailLoadTask(QRunnable):
+    """QImageReader로 표시 크기에 맞춰 바로 decode (원본 크기 decode 후 축소하지 않음)"""
+
+    def __init__(self, path, width, signals):
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.signals = signals
+
+    def run(self):
+        reader = QImageReader(self.path)
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid() and size.width() > self.width:
+            reader.setScaledSize(QSize(self.width, max(1, size.height() * self.width // size.width())))
+        image = reader.read()
+        if image.isNull():
+            print(f"[WARN] Thumbnail load failed: {self.path} ({reader.errorString()})")
+        self.signals.loaded.emit(self, image)
+
+
+class ThumbnailLoader(QObject):
+    """
+    보이는 행의 썸네일만 QThreadPool에서 비동기로 읽고 PixmapCache에 보관
+    로드가 끝나면 thumbnail_ready(path) 시그널 발생
+    """
+    thumbnail_ready = Signal(str)
+
+    def __init__(self, width, max_bytes=DEFAULT_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.width = width
+        self.cache = PixmapCache(max_bytes)
+        self._failed = set()
+        # 경로 -> 로드 중인 task (시작 전이면 스크롤로 화면에서 벗어날 때 pool에서 꺼내 취소)
+        self._pending = {}
+        # pool에 넘긴 task 참조 (autoDelete를 끄고 로드가 끝날 때까지 유지)
+        self._tasks = set()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(DEFAULT_LOADER_THREADS)
+        # 나중에 요청한(지금 화면에 보이는) 썸네일을 먼저 처리
+        self._priority = itertools.count()
+        self._signals = _LoadSignals()
+        self._signals.loaded.connect(self._on_loaded)
+
+    def get(self, path):
+        """캐시에 있으면 pixmap, 없으면 로드를 예약하고 None 반환"""
+        pixmap = self.cache.get(path)
+        if pixmap is not None:
+            return pixmap
+        if path not in self._pending and path not in self._failed:
+            task = ThumbnailLoadTask(path, self.width, self._signals)
+            task.setAutoDelete(False)
+            self._pending[path] = task
+            self._tasks.add(task)
+            self._pool.start(task, next(self._priority) % 0x7FFFFFFF)
+        return None
+
+    def cancel_pending(self):
+        """
+        아직 시작하지 않은 로드를 모두 취소 (화면에 남아 있는 행은 다시 그릴 때 get으로 다시 요청됨)
+        Returns:
+            int: 취소한 task 수
+        """
+        canceled = 0
+        for path, task in list(self._pending.items()):
+            if self._pool.tryTake(task):
+                del self._pending[path]
+                self._tasks.discard(task)
+                canceled += 1
+        return canceled
+
+    def forget_failures(self):
+        """로드에 실패한 경로를 다시 시도하도록 (요청 당시 아직 만들어지지 않았던 썸네일 등)"""
+        self._failed.clear()
+
+    def _on_loaded(self, task, image):
+        self._tasks.discard(task)
+        path = task.path
+        # clear 이전에 시작된 task의 결과는 버림
+        if self._pending.get(path) is not task:
+            return
+        del self._pending[path]
+        if image.isNull():
+            self._failed.add(path)
+            return
+        # QPixmap은 UI 스레드에서만 생성
+        self.cache.put(path, QPixmap.fromImage(image))
+        self.thumbnail_ready.emit(path)
+
+    def clear(self):
+        self.cancel_pending()
+        # 이미 실행 중인 task는 _tasks에 남아 있다가 끝나면 결과를 버림
+        self._pending.clear()
+        self._failed.clear()
+        self.cache.clear()
@@ -0,0 +1,84 @@
+"""
+merge_scan: 다시 스캔한 폴더의 행을 (Directory, 시퀀스 이름)으로 짝짓는지 확인
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python", "app"))
+from tools.merge_scan import ScanDiff, diff_directories, merge_scan
+from tools.sheet import Sheet
+
+DIRECTORY = os.path.normpath("/scan/20241226/A")
+HEADERS = ["seq_name", "shot_name", "Directory", "FileName", "ImageWidth"]
+
+
+def _meta(file_name, width=1920):
+    return {"Directory": DIRECTORY, "FileName": file_name, "ImageWidth": width}
+
+
+def _old_sheet():
+    return Sheet(HEADERS, [
+        ["S010", "S010_0010", DIRECTORY, "A001.1001.exr", 1920],
+        ["S020", "S020_0010", DIRECTORY, "B001.1001.exr", 1920],
+        ["S030", "S030_0010", DIRECTORY, "C001.1001.exr", 1920],
+    ])
+
+
+def _user_fields(sheet):
+    return {sheet.value(row, "FileName"): sheet.value(row, "seq_name") for row in range(len(sheet))}
+
+
+def test_removed_sequence_keeps_other_rows_user_fields():
+    metas = [_meta("B001.1001.exr", 2048), _meta("C001.1001.exr", 2048)]
+    diff = ScanDiff(changed=[DIRECTORY])
+    sheet = merge_scan(_old_sheet(), metas, diff)
+    assert _user_fields(sheet) == {"B001.1001.exr": "S020", "C001.1001.exr": "S030"}
+    assert sheet.column("ImageWidth") == [2048, 2048]
+
+
+def test_inserted_sequence_is_appended_without_user_fields():
+    metas = [_meta("A001.1001.exr"), _meta("AA01.1001.exr"), _meta("B001.1001.exr"), _meta("C001.1001.exr")]
+    diff = ScanDiff(changed=[DIRECTORY])
+    sheet = merge_scan(_old_sheet(), metas, diff)
+    assert _user_fields(sheet) == {
+        "A001.1001.exr": "S010",
+        "B001.1001.exr": "S020",
+        "C001.1001.exr": "S030",
+        "AA01.1001.exr": "",
+    }
+    assert sheet.value(3, "FileName") == "AA01.1001.exr"
+
+
+def test_reordered_scan_and_new_first_frame_match_same_sequence():
+    # 스캔 순서가 바뀌고 A001의 첫 프레임이 1001 -> 0991 로 바뀐 경우
+    metas = [_meta("C001.1001.exr"), _meta("A001.0991.exr", 4096), _meta("B001.1001.exr")]
+    diff = ScanDiff(changed=[DIRECTORY])
+    sheet = merge_scan(_old_sheet(), metas, diff)
+    assert sheet.column("seq_name") == ["S010", "S020", "S030"]
+    assert sheet.column("FileName") == ["A001.0991.exr", "B001.1001.exr", "C001.1001.exr"]
+    assert sheet.value(0, "ImageWidth") == 4096
+
+
+def test_unchanged_directory_is_dropped_from_diff():
+    metas = [_meta("C001.1001.exr"), _meta("A001.1001.exr"), _meta("B001.1001.exr")]
+    diff = ScanDiff(changed=[DIRECTORY])
+    merge_scan(_old_sheet(), metas, diff)
+    assert not diff
+
+
+def _manifest(*directories):
+    return {"sequences": [
+        {"path": os.path.join(directory, "A001.####.exr"), "start": 1001, "end": 1010,
+         "frames": 10, "bytes": 100, "mtime_ns": 1}
+        for directory in directories
+    ]}
+
+
+def test_version_without_manifest_compares_directory_sets():
+    other = os.path.normpath("/scan/20241226/B")
+    # manifest 없이 저장된 버전: 같은 폴더 목록이면 바뀐 것이 없음
+    assert not diff_directories([DIRECTORY], None, _manifest(DIRECTORY))
+    diff = diff_directories([DIRECTORY], None, _manifest(DIRECTORY, other))
+    assert (diff.added, diff.removed, diff.changed) == ({other}, set(), set())
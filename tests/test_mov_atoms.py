@@ -0,0 +1,43 @@
+"""
+mov_atoms: 손상된 MOV는 예외 없이 None (exiftool로 대체)
+
+    python -m pytest tests
+"""
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python", "app"))
+from tools.mov_atoms import MovParseError, read_mov_info, read_mov_metadata
+
+
+def _box(box_type, payload=b""):
+    return struct.pack(">I4s", len(payload) + 8, box_type) + payload
+
+
+def _write(tmp_path, data):
+    path = tmp_path / "clip.mov"
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_empty_mvhd_raises_parse_error(tmp_path):
+    path = _write(tmp_path, _box(b"ftyp", b"qt  ") + _box(b"moov", _box(b"mvhd")))
+    with pytest.raises(MovParseError):
+        read_mov_info(path)
+
+
+@pytest.mark.parametrize("data", [
+    # mvhd payload가 비어 있음
+    _box(b"ftyp", b"qt  ") + _box(b"moov", _box(b"mvhd")),
+    # mvhd가 중간에서 잘림
+    _box(b"ftyp", b"qt  ") + _box(b"moov", _box(b"mvhd", b"\x00\x00\x00\x00\x00\x00")),
+    # track의 mdhd payload가 비어 있음
+    _box(b"moov", _box(b"trak", _box(b"mdia", _box(b"mdhd")))),
+    # 잘린 ftyp만 있고 moov가 없는 파일
+    _box(b"ftyp", b"qt  ")[:10],
+])
+def test_truncated_mov_falls_back_to_exiftool(tmp_path, data):
+    assert read_mov_metadata(_write(tmp_path, data)) is None
@@ -0,0 +1,34 @@
+"""
+sequence_scanner.scan: 자릿수(padding)가 다른 파일은 다른 시퀀스로 묶는지 확인
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python", "app"))
+from tools.sequence_scanner import scan
+
+DIRECTORY = os.path.normpath("/scan/20241226/A")
+
+
+def _paths(names):
+    return [seq.path() for seq in scan(DIRECTORY, names)]
+
+
+def test_different_padding_is_split_into_sequences():
+    names = ["A.001.exr", "A.002.exr", "A.0001.exr", "A.0002.exr"]
+    assert _paths(names) == [os.path.join(DIRECTORY, "A.%03d.exr"), os.path.join(DIRECTORY, "A.%04d.exr")]
+
+
+def test_frame_number_outgrowing_padding_stays_in_sequence():
+    names = ["A.0998.exr", "A.0999.exr", "A.1000.exr", "A.10000.exr"]
+    (seq,) = scan(DIRECTORY, names)
+    assert seq.padding == 4
+    assert seq.frames == [998, 999, 1000, 10000]
+    assert [frame.path for frame in seq][-1] == os.path.join(DIRECTORY, "A.10000.exr")
+
+
+def test_unpadded_frames_are_one_sequence():
+    (seq,) = scan(DIRECTORY, ["A.9.exr", "A.10.exr", "A.11.exr"])
+    assert seq.path() == os.path.join(DIRECTORY, "A.%d.exr")